@@ -16,7 +16,7 @@ from plotly.subplots import make_subplots
 from src.download_sp500_data import download_sp500_data
 
 from src.data import IndicatorStorage, OptionsDataManager, StockDataManager
-from src.ui import t, use_language_selector
+from src.ui import available_symbols, t, use_language_selector
 
 
 DEFAULT_INTERVAL = "1d"
@@ -136,6 +136,9 @@ def show():
     stock_mgr = StockDataManager()
     options_mgr = OptionsDataManager()
 
+    # Cached stock symbols are read once per rerun and shared by every tab
+    cached_symbols = stock_mgr.get_available_symbols()
+
     def _sync_cached_selection() -> None:
         symbol = st.session_state.get("cached_symbol_select")
         if symbol:
@@ -229,6 +232,8 @@ def show():
                         )
 
                         if latest_results["success"]:
+                            available_symbols.clear()
+                            cached_symbols = stock_mgr.get_available_symbols()
                             st.success(
                                 t(
                                     "data.stocks.download_success",
@@ -300,6 +305,8 @@ def show():
                         )
 
                         if results["success"]:
+                            available_symbols.clear()
+                            cached_symbols = stock_mgr.get_available_symbols()
                             st.success(
                                 t(
                                     "data.stocks.download_success",
@@ -334,6 +341,8 @@ def show():
                 with st.spinner(t("data.stocks.bulk_spinner")):
                     try:
                         bundle = download_sp500_data()
+                        available_symbols.clear()
+                        cached_symbols = stock_mgr.get_available_symbols()
                         bundle_results = bundle["results"]
                         symbols = bundle["symbols"]
 
@@ -390,7 +399,6 @@ def show():
         with col2:
             st.subheader(t("data.stocks.cached_title"))
 
-            cached_symbols = stock_mgr.get_available_symbols()
             if cached_symbols:
                 cached_selector_options = _merge_favorites_with_options(cached_symbols)
 
@@ -520,8 +528,7 @@ def show():
         st.divider()
         st.subheader(t("data.stocks.viewer_title"))
 
-        available_symbols = stock_mgr.get_available_symbols()
-        viewer_options = _merge_favorites_with_options(available_symbols)
+        viewer_options = _merge_favorites_with_options(cached_symbols)
 
         if not viewer_options:
             st.info(t("data.stocks.viewer_empty"))
@@ -538,7 +545,7 @@ def show():
                 key="viewer_symbol",
             )
 
-            if viewer_symbol not in available_symbols:
+            if viewer_symbol not in cached_symbols:
                 st.info(t("data.stocks.viewer_no_rows"))
             else:
                 page_size = st.selectbox(
@@ -603,6 +610,7 @@ def show():
                     ):
                         try:
                             delete_result = stock_mgr.delete_symbol(viewer_symbol)
+                            available_symbols.clear()
                             st.success(
                                 t(
                                     "data.stocks.delete_symbol_success",
@@ -637,6 +645,7 @@ def show():
         ):
             try:
                 delete_all_result = stock_mgr.delete_all()
+                available_symbols.clear()
                 st.success(
                     t(
                         "data.stocks.delete_all_success",
@@ -682,6 +691,8 @@ def show():
                     os.unlink(tmp_path)
                     
                     if result.get("success"):
+                        available_symbols.clear()
+                        cached_symbols = stock_mgr.get_available_symbols()
                         st.success(
                             t(
                                 "data.upload.success",
@@ -1350,7 +1361,6 @@ def show():
         st.header(t("data.indicators.header"))
         
         # Symbol selection
-        cached_symbols = stock_mgr.get_available_symbols()
         indicator_options = _merge_favorites_with_options(cached_symbols)
 
         if not indicator_options:
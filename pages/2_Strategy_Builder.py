@@ -2,15 +2,74 @@
 Strategy Builder page for creating and editing strategies.
 """
 import streamlit as st
-import json
+import pandas as pd
 from datetime import datetime
 from src.strategy import NLParser, StrategyCompiler, CodeValidator
 from src.models import Strategy
+from src import json_utils
 from src.db import get_db
-from src.ui import t, use_language_selector
+from src.ui import active_llm_config, clear_strategy_caches, parse_symbols, t, use_language_selector
 import uuid
 
 
+@st.cache_data(show_spinner=False)
+def _validate_strategy(json_text: str):
+    """Parse and validate strategy JSON, memoized on the raw text.
+
+    Returns:
+        Tuple of (strategy dict or None, error message)
+    """
+    try:
+        strategy_dict = json_utils.loads(json_text)
+        Strategy(**strategy_dict)
+        return strategy_dict, ""
+    except Exception as e:
+        return None, str(e)
+
+
+@st.cache_resource
+def _get_parser(llm_config=None) -> NLParser:
+    """Shared parser instance for the given LLM configuration."""
+    return NLParser(use_llm=bool(llm_config), llm_config=llm_config)
+
+
+@st.cache_resource
+def _get_compiler() -> StrategyCompiler:
+    """Shared strategy compiler instance."""
+    return StrategyCompiler()
+
+
+@st.cache_resource
+def _get_validator() -> CodeValidator:
+    """Shared code validator instance."""
+    return CodeValidator()
+
+
+@st.cache_data(show_spinner=False)
+def _validate_code(code: str):
+    """Validate Backtrader strategy code, memoized on the source text."""
+    return _get_validator().validate_backtrader_strategy(code)
+
+
+def _set_json_definition(strategy_dict) -> None:
+    """Store the strategy dict together with its serialized JSON string."""
+    st.session_state.json_definition = strategy_dict
+    st.session_state.json_definition_str = (
+        json_utils.dumps(strategy_dict) if strategy_dict is not None else None
+    )
+
+
+def _pretty_json_definition() -> str:
+    """Indented JSON for the current definition, re-serialized only when it changes."""
+    signature = id(st.session_state.json_definition)
+    if st.session_state.get("_json_definition_pretty_sig") != signature:
+        st.session_state._json_definition_pretty = json_utils.dumps(
+            st.session_state.json_definition, indent=True
+        )
+        st.session_state._json_definition_pretty_sig = signature
+    return st.session_state._json_definition_pretty
+
+
 def show():
     """Display the strategy builder page."""
     use_language_selector()
@@ -22,7 +81,7 @@ def show():
     db = get_db()
     
     # Load active LLM config from database
-    llm_config_row = db.fetchone("SELECT * FROM llm_configs WHERE is_active = 1")
+    llm_config_row = active_llm_config()
     llm_config = None
     if llm_config_row:
         llm_config = {
@@ -32,15 +91,16 @@ def show():
         }
     
     # Initialize components
-    parser = NLParser(use_llm=bool(llm_config), llm_config=llm_config)
-    compiler = StrategyCompiler()
-    validator = CodeValidator()
+    parser = _get_parser(llm_config)
+    compiler = _get_compiler()
     
     # Initialize session state for three formats
     if 'human_readable' not in st.session_state:
         st.session_state.human_readable = ""
     if 'json_definition' not in st.session_state:
         st.session_state.json_definition = None
+    if 'json_definition_str' not in st.session_state:
+        st.session_state.json_definition_str = None
     if 'backtrader_code' not in st.session_state:
         st.session_state.backtrader_code = ""
     
@@ -89,14 +149,14 @@ def show():
                     # Parse symbols if provided
                     symbols = None
                     if override_symbols:
-                        symbols = [s.strip().upper() for s in override_symbols.split(",")]
+                        symbols = parse_symbols(override_symbols)
                     
                     # Parse strategy using LLM (returns three formats)
                     human_readable, strategy_dict, backtrader_code = parser.parse_with_llm(nl_text)
                     
                     # Update session state
                     st.session_state.human_readable = human_readable
-                    st.session_state.json_definition = strategy_dict
+                    _set_json_definition(strategy_dict)
                     st.session_state.backtrader_code = backtrader_code
                     
                     st.success(t("builder.define.success"))
@@ -107,130 +167,155 @@ def show():
         # Three editable format sections
         st.subheader(t("builder.define.formats_header"))
         
-        # Create three columns for the format tabs
-        format_tab1, format_tab2, format_tab3 = st.tabs([
-            t("builder.define.format_human"),
-            t("builder.define.format_json"),
-            t("builder.define.format_code")
-        ])
-        
-        # Human Readable Format
-        with format_tab1:
-            st.write(t("builder.define.human_description"))
-            human_readable_edited = st.text_area(
-                t("builder.define.human_label"),
-                value=st.session_state.human_readable,
-                height=300,
-                key="human_readable_editor"
-            )
-            if st.button(t("builder.define.update_human"), key="update_human"):
-                st.session_state.human_readable = human_readable_edited
-                st.success(t("builder.define.update_success"))
-        
-        # JSON Format
-        with format_tab2:
-            st.write(t("builder.define.json_description"))
-            
-            if st.session_state.json_definition:
-                json_str = json.dumps(st.session_state.json_definition, indent=2)
-            else:
-                # Show example
-                json_str = json.dumps({
-                    "name": "SMA Cross Strategy",
-                    "universe": ["AAPL"],
-                    "timeframe": {
-                        "start": "2019-01-01",
-                        "end": "2024-12-31",
-                        "interval": "1d"
-                    },
-                    "entry": [
-                        {
-                            "type": "indicator",
-                            "ind": "SMA",
-                            "period": 50,
-                            "op": ">",
-                            "rhs": {"ind": "SMA", "period": 200}
-                        }
-                    ],
-                    "exit": [
-                        {"type": "trailing_stop", "percent": 0.08},
-                        {"type": "take_profit", "percent": 0.15}
-                    ],
-                    "position": {
-                        "sizing": "percent_cash",
-                        "value": 0.25,
-                        "max_positions": 4
-                    },
-                    "costs": {
-                        "commission_per_share": 0.005,
-                        "slippage_bps": 5
-                    }
-                }, indent=2)
+        # Editors live in one form so typing does not trigger reruns;
+        # only the submit buttons below send the edited values.
+        with st.form("define_form", clear_on_submit=False):
+            # Create three columns for the format tabs
+            format_tab1, format_tab2, format_tab3 = st.tabs([
+                t("builder.define.format_human"),
+                t("builder.define.format_json"),
+                t("builder.define.format_code")
+            ])
             
-            json_edited = st.text_area(
-                t("builder.define.json_label"),
-                value=json_str,
-                height=400,
-                key="json_editor"
-            )
+            # Human Readable Format
+            with format_tab1:
+                st.write(t("builder.define.human_description"))
+                human_readable_edited = st.text_area(
+                    t("builder.define.human_label"),
+                    value=st.session_state.human_readable,
+                    height=300,
+                    key="human_readable_editor"
+                )
+                if st.form_submit_button(t("builder.define.update_human")):
+                    st.session_state.human_readable = human_readable_edited
+                    st.success(t("builder.define.update_success"))
             
-            col1, col2 = st.columns(2)
-            with col1:
-                if st.button(t("builder.define.validate_json"), key="validate_json"):
-                    try:
-                        strategy_dict = json.loads(json_edited)
-                        # Validate with Pydantic model
-                        strategy_model = Strategy(**strategy_dict)
-                        st.session_state.json_definition = strategy_dict
-                        st.success(t("builder.define.validate_success"))
-                    except Exception as e:
-                        st.error(t("builder.define.validate_error", error=str(e)))
+            # JSON Format
+            with format_tab2:
+                st.write(t("builder.define.json_description"))
+                
+                if st.session_state.json_definition:
+                    json_str = _pretty_json_definition()
+                else:
+                    # Show example
+                    json_str = json_utils.dumps({
+                        "name": "SMA Cross Strategy",
+                        "universe": ["AAPL"],
+                        "timeframe": {
+                            "start": "2019-01-01",
+                            "end": "2024-12-31",
+                            "interval": "1d"
+                        },
+                        "entry": [
+                            {
+                                "type": "indicator",
+                                "ind": "SMA",
+                                "period": 50,
+                                "op": ">",
+                                "rhs": {"ind": "SMA", "period": 200}
+                            }
+                        ],
+                        "exit": [
+                            {"type": "trailing_stop", "percent": 0.08},
+                            {"type": "take_profit", "percent": 0.15}
+                        ],
+                        "position": {
+                            "sizing": "percent_cash",
+                            "value": 0.25,
+                            "max_positions": 4
+                        },
+                        "costs": {
+                            "commission_per_share": 0.005,
+                            "slippage_bps": 5
+                        }
+                    }, indent=True)
+                
+                json_edited = st.text_area(
+                    t("builder.define.json_label"),
+                    value=json_str,
+                    height=400,
+                    key="json_editor"
+                )
+                
+                col1, col2 = st.columns(2)
+                with col1:
+                    if st.form_submit_button(t("builder.define.validate_json")):
+                        strategy_dict, error = _validate_strategy(json_edited)
+                        if strategy_dict is not None:
+                            _set_json_definition(strategy_dict)
+                            st.success(t("builder.define.validate_success"))
+                        else:
+                            st.error(t("builder.define.validate_error", error=error))
+                
+                with col2:
+                    if st.form_submit_button(t("builder.define.compile_json")):
+                        try:
+                            strategy_dict = json_utils.loads(json_edited)
+                            code = compiler.compile(strategy_dict)
+                            _set_json_definition(strategy_dict)
+                            st.session_state.backtrader_code = code
+                            
+                            # Validate code
+                            is_valid, violations = _validate_code(code)
+                            if is_valid:
+                                st.success(t("builder.define.compile_success"))
+                            else:
+                                st.warning(t("builder.define.compile_warning"))
+                                for v in violations:
+                                    st.write(f"- {v}")
+                            st.rerun()
+                        except Exception as e:
+                            st.error(t("builder.define.compile_error", error=str(e)))
             
-            with col2:
-                if st.button(t("builder.define.compile_json"), key="compile_json"):
-                    try:
-                        strategy_dict = json.loads(json_edited)
-                        code = compiler.compile(strategy_dict)
-                        st.session_state.json_definition = strategy_dict
-                        st.session_state.backtrader_code = code
-                        
-                        # Validate code
-                        is_valid, violations = validator.validate_backtrader_strategy(code)
+            # Backtrader Code Format
+            with format_tab3:
+                st.write(t("builder.define.code_description"))
+                code_edited = st.text_area(
+                    t("builder.define.code_label"),
+                    value=st.session_state.backtrader_code,
+                    height=400,
+                    key="code_editor"
+                )
+                
+                col1, col2 = st.columns(2)
+                with col1:
+                    if st.form_submit_button(t("builder.define.validate_code")):
+                        is_valid, violations = _validate_code(code_edited)
                         if is_valid:
-                            st.success(t("builder.define.compile_success"))
+                            st.session_state.backtrader_code = code_edited
+                            st.success(t("builder.define.code_valid"))
                         else:
-                            st.warning(t("builder.define.compile_warning"))
+                            st.warning(t("builder.define.code_warnings"))
                             for v in violations:
                                 st.write(f"- {v}")
-                        st.rerun()
-                    except Exception as e:
-                        st.error(t("builder.define.compile_error", error=str(e)))
-        
-        # Backtrader Code Format
-        with format_tab3:
-            st.write(t("builder.define.code_description"))
-            code_edited = st.text_area(
-                t("builder.define.code_label"),
-                value=st.session_state.backtrader_code,
-                height=400,
-                key="code_editor"
-            )
-            
-            col1, col2 = st.columns(2)
-            with col1:
-                if st.button(t("builder.define.validate_code"), key="validate_code"):
-                    is_valid, violations = validator.validate_backtrader_strategy(code_edited)
-                    if is_valid:
+                
+                with col2:
+                    if st.form_submit_button(t("builder.define.update_code")):
                         st.session_state.backtrader_code = code_edited
-                        st.success(t("builder.define.code_valid"))
-                    else:
-                        st.warning(t("builder.define.code_warnings"))
-                        for v in violations:
-                            st.write(f"- {v}")
-            
-            with col2:
-                if st.button(t("builder.define.update_code"), key="update_code"):
-                    st.session_state.backtrader_code = code_edited
+                        st.success(t("builder.define.update_success"))
+
+            update_all = st.form_submit_button(
+                t("builder.define.update_all"),
+                type="primary"
+            )
+            if update_all:
+                # Apply all three editors in a single pass
+                st.session_state.human_readable = human_readable_edited
+                
+                strategy_dict, error = _validate_strategy(json_edited)
+                if strategy_dict is not None:
+                    _set_json_definition(strategy_dict)
+                else:
+                    st.error(t("builder.define.validate_error", error=error))
+                
+                st.session_state.backtrader_code = code_edited
+                is_valid, violations = _validate_code(code_edited)
+                if not is_valid:
+                    st.warning(t("builder.define.code_warnings"))
+                    for v in violations:
+                        st.write(f"- {v}")
+                
+                if strategy_dict is not None and is_valid:
                     st.success(t("builder.define.update_success"))
         
         # Save all three formats
@@ -252,26 +337,47 @@ def show():
                 else:
                     # Save to database
                     strategy_id = f"strat_{uuid.uuid4().hex[:8]}"
+                    json_definition_str = (
+                        st.session_state.json_definition_str
+                        or json_utils.dumps(st.session_state.json_definition)
+                    )
+                    
+                    created_at = datetime.now().isoformat()
                     
-                    # Save strategy with all three formats
-                    db.execute(
-                        """INSERT INTO strategies (
-                            id, name, version, json, 
-                            human_readable, json_definition, backtrader_code,
-                            created_at
-                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
-                        (
-                            strategy_id, 
-                            strategy_name, 
-                            1,
-                            json.dumps(st.session_state.json_definition),  # Legacy compatibility
-                            st.session_state.human_readable,
-                            json.dumps(st.session_state.json_definition),
-                            st.session_state.backtrader_code,
-                            datetime.now().isoformat()
+                    # Save strategy with all three formats, plus its code row,
+                    # in a single transaction
+                    with db.transaction() as tx:
+                        tx.execute(
+                            """INSERT INTO strategies (
+                                id, name, version, json, 
+                                human_readable, json_definition, backtrader_code,
+                                created_at
+                            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
+                            (
+                                strategy_id, 
+                                strategy_name, 
+                                1,
+                                json_definition_str,  # Legacy compatibility
+                                st.session_state.human_readable,
+                                json_definition_str,
+                                st.session_state.backtrader_code,
+                                created_at
+                            )
                         )
-                    )
+                        if st.session_state.backtrader_code:
+                            tx.execute(
+                                """INSERT INTO codes (id, strategy_id, language, code, created_at)
+                                   VALUES (?, ?, ?, ?, ?)""",
+                                (
+                                    f"{strategy_id}_code",
+                                    strategy_id,
+                                    'python',
+                                    st.session_state.backtrader_code,
+                                    created_at
+                                )
+                            )
                     
+                    clear_strategy_caches()
                     st.success(t("builder.define.save_success", strategy_id=strategy_id))
                     st.session_state['saved_strategy_id'] = strategy_id
     
@@ -285,58 +391,83 @@ def show():
         )
         
         if strategies:
-            for strat in strategies:
-                with st.expander(f"📋 {strat['name']} (v{strat['version']})"):
-                    st.write(t("builder.saved.id", value=strat['id']))
-                    st.write(t("builder.saved.created", value=strat['created_at']))
+            strategies_df = pd.DataFrame(strategies)[["name", "version", "created_at", "id"]]
+            strategies_df.columns = [
+                t("builder.saved.column_name"),
+                t("builder.saved.column_version"),
+                t("builder.saved.column_created"),
+                t("builder.saved.column_id"),
+            ]
+            
+            # One table widget instead of an expander and buttons per row;
+            # details are only loaded for the selected strategy
+            selection = st.dataframe(
+                strategies_df,
+                hide_index=True,
+                use_container_width=True,
+                selection_mode="single-row",
+                on_select="rerun",
+                key="saved_strategies_table",
+            )
+            selected_rows = [i for i in selection.selection.rows if i < len(strategies)]
+            
+            if not selected_rows:
+                st.caption(t("builder.saved.select_hint"))
+            else:
+                strat = strategies[selected_rows[0]]
+                st.subheader(f"📋 {strat['name']} (v{strat['version']})")
+                st.write(t("builder.saved.id", value=strat['id']))
+                st.write(t("builder.saved.created", value=strat['created_at']))
+                
+                # Load full strategy data
+                full_strat = db.fetchone(
+                    """SELECT human_readable, json_definition, backtrader_code, json 
+                       FROM strategies WHERE id = ?""",
+                    (strat['id'],)
+                )
+                
+                # Show three formats in tabs
+                saved_tab1, saved_tab2, saved_tab3 = st.tabs([
+                    t("builder.saved.format_human"),
+                    t("builder.saved.format_json"),
+                    t("builder.saved.format_code")
+                ])
+                
+                with saved_tab1:
+                    human_text = full_strat.get('human_readable', '')
+                    if not human_text and full_strat.get('json'):
+                        # Generate from JSON if missing
+                        try:
+                            strategy_dict = json_utils.loads(full_strat['json'])
+                            human_text = parser._generate_human_readable(strategy_dict)
+                        except:
+                            human_text = "Not available"
                     
-                    # Load full strategy data
-                    full_strat = db.fetchone(
-                        """SELECT human_readable, json_definition, backtrader_code, json 
-                           FROM strategies WHERE id = ?""",
-                        (strat['id'],)
+                    edited_human = st.text_area(
+                        t("builder.saved.human_label"),
+                        value=human_text,
+                        height=200,
+                        key=f"saved_human_{strat['id']}"
                     )
                     
-                    # Show three formats in tabs
-                    saved_tab1, saved_tab2, saved_tab3 = st.tabs([
-                        t("builder.saved.format_human"),
-                        t("builder.saved.format_json"),
-                        t("builder.saved.format_code")
-                    ])
-                    
-                    with saved_tab1:
-                        human_text = full_strat.get('human_readable', '')
-                        if not human_text and full_strat.get('json'):
-                            # Generate from JSON if missing
-                            try:
-                                strategy_dict = json.loads(full_strat['json'])
-                                human_text = parser._generate_human_readable(strategy_dict)
-                            except:
-                                human_text = "Not available"
-                        
-                        edited_human = st.text_area(
-                            t("builder.saved.human_label"),
-                            value=human_text,
-                            height=200,
-                            key=f"saved_human_{strat['id']}"
+                    if st.button(t("builder.saved.update_button"), key=f"update_human_{strat['id']}"):
+                        db.execute(
+                            "UPDATE strategies SET human_readable = ? WHERE id = ?",
+                            (edited_human, strat['id'])
                         )
-                        
-                        if st.button(t("builder.saved.update_button"), key=f"update_human_{strat['id']}"):
-                            db.execute(
-                                "UPDATE strategies SET human_readable = ? WHERE id = ?",
-                                (edited_human, strat['id'])
-                            )
-                            st.success(t("builder.saved.update_success"))
-                            st.rerun()
+                        st.success(t("builder.saved.update_success"))
+                        st.rerun()
+                
+                with saved_tab2:
+                    json_text = full_strat.get('json_definition') or full_strat.get('json', '{}')
+                    try:
+                        json_dict = json_utils.loads(json_text) if isinstance(json_text, str) else json_text
+                        json_formatted = json_utils.dumps(json_dict, indent=True)
+                    except:
+                        json_formatted = json_text
                     
-                    with saved_tab2:
-                        json_text = full_strat.get('json_definition') or full_strat.get('json', '{}')
-                        try:
-                            json_dict = json.loads(json_text) if isinstance(json_text, str) else json_text
-                            json_formatted = json.dumps(json_dict, indent=2)
-                        except:
-                            json_formatted = json_text
-                        
+                    # Edits are only sent when one of the submit buttons is pressed
+                    with st.form(f"saved_json_form_{strat['id']}", clear_on_submit=False):
                         edited_json = st.text_area(
                             t("builder.saved.json_label"),
                             value=json_formatted,
@@ -346,87 +477,106 @@ def show():
                         
                         col1, col2 = st.columns(2)
                         with col1:
-                            if st.button(t("builder.saved.validate_button"), key=f"validate_json_{strat['id']}"):
-                                try:
-                                    strategy_dict = json.loads(edited_json)
-                                    Strategy(**strategy_dict)
+                            if st.form_submit_button(t("builder.saved.validate_button")):
+                                strategy_dict, error = _validate_strategy(edited_json)
+                                if strategy_dict is not None:
                                     st.success(t("builder.saved.validate_success"))
-                                except Exception as e:
-                                    st.error(t("builder.saved.validate_error", error=str(e)))
+                                else:
+                                    st.error(t("builder.saved.validate_error", error=error))
                         
                         with col2:
-                            if st.button(t("builder.saved.update_button"), key=f"update_json_{strat['id']}"):
+                            if st.form_submit_button(t("builder.saved.update_button")):
                                 try:
-                                    strategy_dict = json.loads(edited_json)
+                                    strategy_dict = json_utils.loads(edited_json)
                                     db.execute(
                                         "UPDATE strategies SET json_definition = ?, json = ? WHERE id = ?",
                                         (edited_json, edited_json, strat['id'])
                                     )
+                                    clear_strategy_caches()
                                     st.success(t("builder.saved.update_success"))
                                     st.rerun()
                                 except Exception as e:
                                     st.error(t("builder.saved.update_error", error=str(e)))
+                
+                with saved_tab3:
+                    code_text = full_strat.get('backtrader_code', '')
+                    if not code_text and full_strat.get('json'):
+                        # Generate from JSON if missing
+                        try:
+                            strategy_dict = json_utils.loads(full_strat['json'])
+                            code_text = compiler.compile(strategy_dict)
+                        except:
+                            code_text = "# Code generation failed"
                     
-                    with saved_tab3:
-                        code_text = full_strat.get('backtrader_code', '')
-                        if not code_text and full_strat.get('json'):
-                            # Generate from JSON if missing
-                            try:
-                                strategy_dict = json.loads(full_strat['json'])
-                                code_text = compiler.compile(strategy_dict)
-                            except:
-                                code_text = "# Code generation failed"
-                        
-                        edited_code = st.text_area(
-                            t("builder.saved.code_label"),
-                            value=code_text,
-                            height=300,
-                            key=f"saved_code_{strat['id']}"
-                        )
-                        
-                        col1, col2 = st.columns(2)
-                        with col1:
-                            if st.button(t("builder.saved.validate_button"), key=f"validate_code_{strat['id']}"):
-                                is_valid, violations = validator.validate_backtrader_strategy(edited_code)
-                                if is_valid:
-                                    st.success(t("builder.saved.code_valid"))
-                                else:
-                                    st.warning(t("builder.saved.code_warnings"))
-                                    for v in violations:
-                                        st.write(f"- {v}")
-                        
-                        with col2:
-                            if st.button(t("builder.saved.update_button"), key=f"update_code_{strat['id']}"):
-                                db.execute(
-                                    "UPDATE strategies SET backtrader_code = ? WHERE id = ?",
-                                    (edited_code, strat['id'])
-                                )
-                                st.success(t("builder.saved.update_success"))
-                                st.rerun()
+                    edited_code = st.text_area(
+                        t("builder.saved.code_label"),
+                        value=code_text,
+                        height=300,
+                        key=f"saved_code_{strat['id']}"
+                    )
                     
-                    # Load and Delete buttons
-                    st.divider()
                     col1, col2 = st.columns(2)
-                    
                     with col1:
-                        if st.button(t("builder.saved.load_button"), key=f"load_{strat['id']}", type="primary"):
-                            # Load into Define Strategy tab
-                            try:
-                                json_data = full_strat.get('json_definition') or full_strat.get('json')
-                                st.session_state.json_definition = json.loads(json_data) if isinstance(json_data, str) else json_data
-                                st.session_state.human_readable = full_strat.get('human_readable', '')
-                                st.session_state.backtrader_code = full_strat.get('backtrader_code', '')
-                                st.success(t("builder.saved.load_success"))
-                                st.rerun()
-                            except Exception as e:
-                                st.error(t("builder.saved.load_error", error=str(e)))
+                        if st.button(t("builder.saved.validate_button"), key=f"validate_code_{strat['id']}"):
+                            is_valid, violations = _validate_code(edited_code)
+                            if is_valid:
+                                st.success(t("builder.saved.code_valid"))
+                            else:
+                                st.warning(t("builder.saved.code_warnings"))
+                                for v in violations:
+                                    st.write(f"- {v}")
                     
                     with col2:
-                        if st.button(t("builder.saved.delete_button"), key=f"del_{strat['id']}", type="secondary"):
-                            db.execute("DELETE FROM strategies WHERE id = ?", (strat['id'],))
-                            db.execute("DELETE FROM codes WHERE strategy_id = ?", (strat['id'],))
-                            st.success(t("builder.saved.delete_success"))
+                        if st.button(t("builder.saved.update_button"), key=f"update_code_{strat['id']}"):
+                            # Edited code gets a fresh codes row, so backtests
+                            # pick it up and caches keyed on code_id miss;
+                            # earlier rows stay for the runs that used them
+                            with db.transaction() as tx:
+                                tx.execute(
+                                    "UPDATE strategies SET backtrader_code = ? WHERE id = ?",
+                                    (edited_code, strat['id'])
+                                )
+                                tx.execute(
+                                    """INSERT INTO codes (id, strategy_id, language, code, created_at)
+                                       VALUES (?, ?, ?, ?, ?)""",
+                                    (
+                                        f"{strat['id']}_code_{uuid.uuid4().hex[:8]}",
+                                        strat['id'],
+                                        'python',
+                                        edited_code,
+                                        datetime.now().isoformat()
+                                    )
+                                )
+                            clear_strategy_caches()
+                            st.success(t("builder.saved.update_success"))
                             st.rerun()
+                
+                # Load and Delete buttons
+                st.divider()
+                col1, col2 = st.columns(2)
+                
+                with col1:
+                    if st.button(t("builder.saved.load_button"), key=f"load_{strat['id']}", type="primary"):
+                        # Load into Define Strategy tab
+                        try:
+                            json_data = full_strat.get('json_definition') or full_strat.get('json')
+                            _set_json_definition(json_utils.loads(json_data) if isinstance(json_data, str) else json_data)
+                            st.session_state.human_readable = full_strat.get('human_readable', '')
+                            st.session_state.backtrader_code = full_strat.get('backtrader_code', '')
+                            st.success(t("builder.saved.load_success"))
+                            st.rerun()
+                        except Exception as e:
+                            st.error(t("builder.saved.load_error", error=str(e)))
+                
+                with col2:
+                    if st.button(t("builder.saved.delete_button"), key=f"del_{strat['id']}", type="secondary"):
+                        with db.transaction() as tx:
+                            tx.execute("DELETE FROM codes WHERE strategy_id = ?", (strat['id'],))
+                            tx.execute("DELETE FROM strategies WHERE id = ?", (strat['id'],))
+                        clear_strategy_caches()
+                        st.session_state.pop("saved_strategies_table", None)
+                        st.success(t("builder.saved.delete_success"))
+                        st.rerun()
         else:
             st.info(t("builder.saved.empty"))
 
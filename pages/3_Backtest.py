@@ -1,15 +1,27 @@
 """Backtest execution page."""
-import json
+import threading
 import uuid
-from datetime import datetime, timedelta
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from types import CodeType
+from typing import Any, Dict, Optional, Tuple
 
 import streamlit as st
 
-from src import config
+from src import config, json_utils
 from src.backtest import BacktestEngine
-from src.data import StockDataManager
 from src.db import get_db
-from src.ui import t, use_language_selector
+from src.ui import (
+    available_symbols,
+    clear_backtest_caches,
+    list_strategies,
+    load_strategy_bundle,
+    parse_symbols,
+    recent_backtests,
+    t,
+    use_language_selector,
+)
 
 _STATUS_ICONS = {
     "completed": "✓",
@@ -18,6 +30,227 @@ _STATUS_ICONS = {
     "pending": "○",
 }
 
+# Seconds between status checks while a backtest job is still running
+_POLL_INTERVAL_SECONDS = 1.0
+
+
+@st.cache_resource
+def _get_engine() -> BacktestEngine:
+    """Shared backtest engine instance."""
+    return BacktestEngine()
+
+
+@st.cache_resource(show_spinner=False)
+def _compiled_strategy(code_id: str, source: str) -> CodeType:
+    """Strategy source compiled to a code object, cached per code row."""
+    return compile(source, f"<strategy {code_id}>", "exec")
+
+
+@lru_cache(maxsize=1024)
+def _parse_iso(value: Optional[str]) -> Optional[date]:
+    """Parse a YYYY-MM-DD string, returning None when missing or invalid."""
+    try:
+        return datetime.strptime(value, "%Y-%m-%d").date()
+    except (TypeError, ValueError):
+        return None
+
+
+@st.cache_resource
+def _get_executor() -> ThreadPoolExecutor:
+    """Shared worker pool that runs backtests off the script thread.
+    
+    Created once per server process, before any backtest of this process
+    is queued, so rows still marked running belong to a process that is
+    gone and are marked failed here.
+    """
+    get_db().execute(
+        "UPDATE backtests SET status = ? WHERE status = ?",
+        ("failed", "running"),
+    )
+    clear_backtest_caches()
+    return ThreadPoolExecutor(max_workers=2, thread_name_prefix="backtest")
+
+
+@st.cache_resource
+def _inflight_backtests() -> Tuple[threading.Lock, Dict[tuple, Tuple[str, Future]]]:
+    """Registry of running backtests keyed by their full configuration.
+    
+    Shared across sessions so an identical request made while the first
+    is still running attaches to that run instead of starting another.
+    """
+    return threading.Lock(), {}
+
+
+def _forget_inflight(
+    inflight_lock: threading.Lock,
+    inflight: Dict[tuple, Tuple[str, Future]],
+    run_key: tuple,
+    future: Future,
+) -> None:
+    """Drop a finished backtest from the in-flight registry.
+    
+    Runs on the worker thread, so the registry is passed in rather than
+    looked up through the Streamlit cache.
+    
+    Args:
+        inflight_lock: Lock guarding the registry
+        inflight: Registry returned by _inflight_backtests
+        run_key: Configuration key the backtest was registered under
+        future: The finished future
+    """
+    with inflight_lock:
+        if inflight.get(run_key, (None, None))[1] is future:
+            del inflight[run_key]
+
+
+def _run_and_record(
+    engine: BacktestEngine,
+    db,
+    bt_id: str,
+    **kwargs,
+) -> Dict[str, Any]:
+    """Run a backtest on the worker pool and record its outcome.
+    
+    The status and metrics are written here rather than by the page, so
+    they land even if the session that started the run has gone away.
+    
+    Args:
+        engine: Backtest engine
+        db: Database instance
+        bt_id: Backtest identifier
+        **kwargs: Keyword arguments for BacktestEngine.run_backtest
+        
+    Returns:
+        The run_backtest result dictionary
+    """
+    try:
+        results = engine.run_backtest(backtest_id=bt_id, **kwargs)
+    except Exception:
+        db.execute(
+            "UPDATE backtests SET status = ? WHERE id = ?",
+            ("failed", bt_id),
+        )
+        clear_backtest_caches()
+        raise
+
+    if not results["success"]:
+        db.execute(
+            "UPDATE backtests SET status = ? WHERE id = ?",
+            ("failed", bt_id),
+        )
+        clear_backtest_caches()
+        return results
+
+    analyzers = results.get("analyzers", {})
+    sharpe_data = analyzers.get("sharpe", {})
+    dd_data = analyzers.get("drawdown", {})
+
+    # Status and metrics land together in one commit
+    with db.transaction() as tx:
+        tx.execute(
+            "UPDATE backtests SET status = ? WHERE id = ?",
+            ("completed", bt_id),
+        )
+        tx.execute(
+            """INSERT OR REPLACE INTO metrics_run 
+               (bt_id, tot_return, cagr, max_dd, sharpe, sortino, calmar, excess_return, benchmarks)
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+            (
+                bt_id,
+                results["total_return"],
+                None,
+                dd_data.get("max_drawdown_pct", 0),
+                sharpe_data.get("sharpe_ratio", 0),
+                None,
+                None,
+                None,
+                json_utils.dumps({}),
+            ),
+        )
+    clear_backtest_caches()
+    return results
+
+
+@st.fragment(run_every=_POLL_INTERVAL_SECONDS)
+def _poll_backtest_jobs() -> None:
+    """Show the running backtests, re-checked on a timer.
+    
+    Only this block reruns while jobs are pending; once one finishes the
+    whole page reruns to show it and refresh the recent backtests.
+    """
+    jobs = st.session_state.get("backtest_jobs", {})
+    if any(future.done() for future in jobs.values()):
+        st.rerun()
+
+    with st.status(t("backtest.spinner.running"), expanded=True):
+        for job_id in jobs:
+            st.write(job_id)
+
+
+def _show_backtest_result(bt_id: str, future: Future) -> None:
+    """Display the outcome of a finished backtest job.
+    
+    The outcome is already recorded by _run_and_record on the worker.
+    
+    Args:
+        bt_id: Backtest identifier
+        future: Completed future returned by the executor
+    """
+    try:
+        results = future.result()
+    except Exception as exc:  # noqa: BLE001
+        st.error(t("backtest.error.exception", message=str(exc)))
+        return
+
+    if not results["success"]:
+        st.error(
+            t(
+                "backtest.error.failed",
+                message=results.get("error", "Unknown error"),
+            )
+        )
+        return
+
+    analyzers = results.get("analyzers", {})
+
+    st.success(t("backtest.success.completed", bt_id=bt_id))
+
+    st.subheader(t("backtest.section.results_summary"))
+
+    col1, col2, col3, col4 = st.columns(4)
+
+    with col1:
+        st.metric(
+            t("backtest.metric.starting_value"),
+            f"${results['starting_value']:,.2f}",
+        )
+
+    with col2:
+        st.metric(
+            t("backtest.metric.ending_value"),
+            f"${results['ending_value']:,.2f}",
+        )
+
+    with col3:
+        total_return_pct = results["total_return"] * 100
+        st.metric(
+            t("backtest.metric.total_return"),
+            f"{total_return_pct:.2f}%",
+            delta=f"{total_return_pct:.2f}%",
+        )
+
+    with col4:
+        trades_data = analyzers.get("trades", {})
+        total_trades = trades_data.get("total_trades", 0)
+        st.metric(
+            t("backtest.metric.total_trades"),
+            total_trades,
+        )
+
+    st.session_state["last_backtest_id"] = bt_id
+
+    st.info(t("backtest.info.view_results"))
+
 
 def show() -> None:
     """Display the backtest page."""
@@ -26,11 +259,12 @@ def show() -> None:
     st.title(t("backtest.title"))
     st.write(t("backtest.subtitle"))
 
-    engine = BacktestEngine()
+    engine = _get_engine()
     db = get_db()
-    stock_mgr = StockDataManager()
+    # Created before anything is queued; see _get_executor
+    executor = _get_executor()
 
-    strategies = db.fetchall("SELECT id, name FROM strategies ORDER BY created_at DESC")
+    strategies = list_strategies()
 
     if not strategies:
         st.warning(t("backtest.warning.no_strategies"))
@@ -46,22 +280,15 @@ def show() -> None:
 
     strategy_id = strategy_options[selected_strategy]
 
-    strategy_rec = db.fetchone(
-        "SELECT json FROM strategies WHERE id = ?",
-        (strategy_id,),
-    )
-    strategy_data = json.loads(strategy_rec["json"])
-
-    code_rec = db.fetchone(
-        "SELECT id, code FROM codes WHERE strategy_id = ? ORDER BY created_at DESC LIMIT 1",
-        (strategy_id,),
-    )
+    bundle = load_strategy_bundle(strategy_id)
+    strategy_data = json_utils.loads(bundle["json"])
 
-    if not code_rec:
+    if not bundle["code_id"]:
         st.error(t("backtest.error.no_code"))
         return
 
-    code_id = code_rec["id"]
+    code_id = bundle["code_id"]
+    strategy_code = bundle["code"]
 
     with st.expander(t("backtest.expander.strategy_details")):
         st.json(strategy_data)
@@ -76,10 +303,10 @@ def show() -> None:
             t("backtest.form.universe"),
             value=", ".join(default_universe),
         )
-        universe = [s.strip().upper() for s in universe_input.split(",") if s.strip()]
+        universe = parse_symbols(universe_input)
 
-        available_symbols = stock_mgr.get_available_symbols()
-        missing_symbols = [s for s in universe if s not in available_symbols]
+        cached_symbols = available_symbols()
+        missing_symbols = [s for s in universe if s not in cached_symbols]
 
         if missing_symbols:
             st.warning(
@@ -91,24 +318,8 @@ def show() -> None:
     today = datetime.today().date()
     twelve_months_ago = today - timedelta(days=365)
 
-    strategy_start = timeframe.get("start")
-    strategy_end = timeframe.get("end")
-
-    if strategy_start:
-        try:
-            strategy_start_date = datetime.strptime(strategy_start, "%Y-%m-%d").date()
-        except ValueError:
-            strategy_start_date = None
-    else:
-        strategy_start_date = None
-
-    if strategy_end:
-        try:
-            strategy_end_date = datetime.strptime(strategy_end, "%Y-%m-%d").date()
-        except ValueError:
-            strategy_end_date = None
-    else:
-        strategy_end_date = None
+    strategy_start_date = _parse_iso(timeframe.get("start"))
+    strategy_end_date = _parse_iso(timeframe.get("end"))
 
     default_start = twelve_months_ago
     if strategy_start_date:
@@ -166,134 +377,94 @@ def show() -> None:
     st.divider()
 
     if st.button(t("backtest.button.run"), type="primary", disabled=bool(missing_symbols)):
-        bt_id = f"bt_{uuid.uuid4().hex[:8]}"
-
-        db.execute(
-            """INSERT INTO backtests 
-               (id, strategy_id, code_id, universe, start, end, initial_cash, benchmarks, status, created_at)
-               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-            (
-                bt_id,
-                strategy_id,
-                code_id,
-                json.dumps(universe),
-                start_date.strftime("%Y-%m-%d"),
-                end_date.strftime("%Y-%m-%d"),
-                initial_cash,
-                json.dumps(selected_benchmarks),
-                "running",
-                datetime.now().isoformat(),
-            ),
+        start_str = start_date.isoformat()
+        end_str = end_date.isoformat()
+        run_key = (
+            strategy_id,
+            code_id,
+            tuple(universe),
+            start_str,
+            end_str,
+            initial_cash,
+            commission,
+            slippage_bps,
+            tuple(selected_benchmarks),
         )
 
-        with st.spinner(t("backtest.spinner.running")):
-            try:
-                results = engine.run_backtest(
-                    strategy_code=code_rec["code"],
+        inflight_lock, inflight = _inflight_backtests()
+        with inflight_lock:
+            running = inflight.get(run_key)
+            if running is not None and not running[1].done():
+                # The same configuration is already running; share its result
+                bt_id, future = running
+            else:
+                bt_id = f"bt_{uuid.uuid4().hex[:8]}"
+                created_at = datetime.now().isoformat()
+
+                db.execute(
+                    """INSERT INTO backtests 
+                       (id, strategy_id, code_id, universe, start, end, initial_cash, benchmarks, status, created_at)
+                       VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                    (
+                        bt_id,
+                        strategy_id,
+                        code_id,
+                        json_utils.dumps(universe),
+                        start_str,
+                        end_str,
+                        initial_cash,
+                        json_utils.dumps(selected_benchmarks),
+                        "running",
+                        created_at,
+                    ),
+                )
+
+                try:
+                    code_obj = _compiled_strategy(code_id, strategy_code)
+                except SyntaxError:
+                    # Leave it to the engine to report the compilation failure
+                    code_obj = None
+
+                # Run on the worker pool so the page stays responsive; the
+                # worker records the outcome and this session only shows it
+                future = executor.submit(
+                    _run_and_record,
+                    engine,
+                    db,
+                    bt_id,
+                    strategy_code=strategy_code,
+                    strategy_code_obj=code_obj,
                     universe=universe,
-                    start=start_date.strftime("%Y-%m-%d"),
-                    end=end_date.strftime("%Y-%m-%d"),
+                    start=start_str,
+                    end=end_str,
                     initial_cash=initial_cash,
                     commission=commission,
                     slippage_bps=slippage_bps,
-                    backtest_id=bt_id,
                 )
-
-                if results["success"]:
-                    db.execute(
-                        "UPDATE backtests SET status = ? WHERE id = ?",
-                        ("completed", bt_id),
+                inflight[run_key] = (bt_id, future)
+                future.add_done_callback(
+                    lambda done, key=run_key: _forget_inflight(
+                        inflight_lock, inflight, key, done
                     )
+                )
 
-                    analyzers = results.get("analyzers", {})
-                    sharpe_data = analyzers.get("sharpe", {})
-                    dd_data = analyzers.get("drawdown", {})
-
-                    db.execute(
-                        """INSERT INTO metrics_run 
-                           (bt_id, tot_return, cagr, max_dd, sharpe, sortino, calmar, excess_return, benchmarks)
-                           VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-                        (
-                            bt_id,
-                            results["total_return"],
-                            None,
-                            dd_data.get("max_drawdown_pct", 0),
-                            sharpe_data.get("sharpe_ratio", 0),
-                            None,
-                            None,
-                            None,
-                            json.dumps({}),
-                        ),
-                    )
-
-                    st.success(t("backtest.success.completed", bt_id=bt_id))
-
-                    st.subheader(t("backtest.section.results_summary"))
-
-                    col1, col2, col3, col4 = st.columns(4)
-
-                    with col1:
-                        st.metric(
-                            t("backtest.metric.starting_value"),
-                            f"${results['starting_value']:,.2f}",
-                        )
-
-                    with col2:
-                        st.metric(
-                            t("backtest.metric.ending_value"),
-                            f"${results['ending_value']:,.2f}",
-                        )
-
-                    with col3:
-                        total_return_pct = results["total_return"] * 100
-                        st.metric(
-                            t("backtest.metric.total_return"),
-                            f"{total_return_pct:.2f}%",
-                            delta=f"{total_return_pct:.2f}%",
-                        )
-
-                    with col4:
-                        trades_data = analyzers.get("trades", {})
-                        total_trades = trades_data.get("total_trades", 0)
-                        st.metric(
-                            t("backtest.metric.total_trades"),
-                            total_trades,
-                        )
-
-                    st.session_state["last_backtest_id"] = bt_id
+        st.session_state.setdefault("backtest_jobs", {})[bt_id] = future
+        recent_backtests.clear()
+        st.rerun()
 
-                    st.info(t("backtest.info.view_results"))
+    jobs = st.session_state.get("backtest_jobs", {})
+    for job_id, future in list(jobs.items()):
+        if future.done():
+            jobs.pop(job_id)
+            _show_backtest_result(job_id, future)
 
-                else:
-                    db.execute(
-                        "UPDATE backtests SET status = ? WHERE id = ?",
-                        ("failed", bt_id),
-                    )
-                    st.error(
-                        t(
-                            "backtest.error.failed",
-                            message=results.get("error", "Unknown error"),
-                        )
-                    )
-
-            except Exception as exc:  # noqa: BLE001
-                db.execute(
-                    "UPDATE backtests SET status = ? WHERE id = ?",
-                    ("failed", bt_id),
-                )
-                st.error(t("backtest.error.exception", message=str(exc)))
+    if jobs:
+        _poll_backtest_jobs()
 
     st.divider()
     st.subheader(t("backtest.section.recent"))
 
-    recent = db.fetchall(
-        """SELECT b.id, s.name, b.status, b.created_at, m.tot_return
-           FROM backtests b
-           JOIN strategies s ON b.strategy_id = s.id
-           LEFT JOIN metrics_run m ON b.id = m.bt_id
-           ORDER BY b.created_at DESC
-           LIMIT 10"""
-    )
+    recent = recent_backtests()
 
     if recent:
         for bt in recent:
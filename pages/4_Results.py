@@ -1,13 +1,212 @@
 """Results visualization page."""
-import json
+import csv
+import io
+from typing import Optional
 
 import pandas as pd
 import streamlit as st
 
-from src.data import StockDataManager
+from src import json_utils
 from src.db import get_db
-from src.ui import t, use_language_selector
-from src.visualization import ChartGenerator
+from src.ui import clear_backtest_caches, load_backtest_bundle, t, use_language_selector
+from src.visualization import ChartGenerator, lttb_downsample
+
+# Result views; each maps to a "results.tabs.<view>" label
+_RESULT_VIEWS = ("equity", "metrics", "trades", "benchmark", "details")
+
+# Metrics shown as percentages; the rest are ratios
+_PERCENT_METRICS = frozenset({"tot_return", "cagr", "max_dd", "excess_return"})
+
+
+def _format_metric(key: str, value: Optional[float]) -> str:
+    """Display string for a metrics_run value."""
+    if value is None:
+        return "N/A"
+    if key in _PERCENT_METRICS:
+        return f"{value * 100:.2f}%"
+    return f"{value:.3f}"
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _load_backtests(signature: tuple) -> list:
+    """Completed backtests, newest first.
+    
+    Args:
+        signature: (count, latest created_at) of completed backtests; a new
+            value means the listing changed and the cache entry is stale
+    """
+    return get_db().fetchall(
+        """SELECT b.id, s.name as strategy_name, b.status, b.created_at, b.start, b.end,
+                  b.universe, b.benchmarks
+           FROM backtests b
+           JOIN strategies s ON b.strategy_id = s.id
+           WHERE b.status = 'completed'
+           ORDER BY b.created_at DESC"""
+    )
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _backtest_options(signature: tuple) -> dict:
+    """Selectbox labels of completed backtests mapped to their IDs.
+    
+    Args:
+        signature: Listing signature, as for ``_load_backtests``
+    """
+    return {
+        f"{bt['strategy_name']} - {bt['created_at'][:10]} ({bt['id']})": bt["id"]
+        for bt in _load_backtests(signature)
+    }
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _load_equity_bundle(bt_id: str) -> dict:
+    """Equity curve and its session statistics.
+    
+    The curve is read column-wise straight into a DataFrame; the session
+    statistics share one round trip.
+    
+    Returns:
+        Dict with ``equity`` (DataFrame of date, value, pnl, return_pct),
+        ``sessions`` (gain/loss session counts) and ``top_gains``/
+        ``top_losses`` (the five best and worst sessions)
+    """
+    db = get_db()
+    # Money columns stay float64: float32 cannot hold cents above ~$100k
+    equity = db.read_frame(
+        """SELECT timestamp AS date, value, COALESCE(pnl, 0) AS pnl,
+                  COALESCE(return_pct, 0) AS return_pct
+           FROM equity_curves
+           WHERE bt_id = ?
+           ORDER BY timestamp""",
+        (bt_id,),
+        parse_dates=["date"],
+        dtype={"value": "float64", "pnl": "float64", "return_pct": "float32"},
+    )
+    bundle = db.fetch_many(
+        {
+            "sessions": (
+                """SELECT SUM(CASE WHEN return_pct > 0 THEN 1 ELSE 0 END) AS gains,
+                          SUM(CASE WHEN return_pct < 0 THEN 1 ELSE 0 END) AS losses
+                       FROM equity_curves
+                       WHERE bt_id = ?""",
+                (bt_id,),
+                True,
+            ),
+            "top_gains": (
+                """SELECT timestamp AS date, COALESCE(return_pct, 0) * 100 AS return_pct,
+                          value, COALESCE(pnl, 0) AS pnl
+                       FROM equity_curves
+                       WHERE bt_id = ?
+                       ORDER BY COALESCE(return_pct, 0) DESC
+                       LIMIT 5""",
+                (bt_id,),
+                False,
+            ),
+            "top_losses": (
+                """SELECT timestamp AS date, COALESCE(return_pct, 0) * 100 AS return_pct,
+                          value, COALESCE(pnl, 0) AS pnl
+                       FROM equity_curves
+                       WHERE bt_id = ?
+                       ORDER BY COALESCE(return_pct, 0) ASC
+                       LIMIT 5""",
+                (bt_id,),
+                False,
+            ),
+        }
+    )
+    bundle["equity"] = equity
+    return bundle
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _load_trades(bt_id: str) -> pd.DataFrame:
+    """Trades recorded for a backtest, in execution order."""
+    return get_db().read_frame(
+        """SELECT timestamp, symbol, action, size, price, value, commission, pnl,
+                  pnl_pct, alloc_pct, portfolio_value, holding_period, reason
+           FROM trades
+           WHERE bt_id = ?
+           ORDER BY seq""",
+        (bt_id,),
+        parse_dates=["timestamp"],
+    )
+
+
+_BENCHMARK_ENDPOINTS_SQL = """
+    SELECT
+        (SELECT close FROM equities_ohlcv
+          WHERE symbol = ? AND interval = '1d' AND date >= ? AND date <= ?
+          ORDER BY date LIMIT 1) AS start_close,
+        (SELECT close FROM equities_ohlcv
+          WHERE symbol = ? AND interval = '1d' AND date >= ? AND date <= ?
+          ORDER BY date DESC LIMIT 1) AS end_close
+"""
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _benchmark_returns(symbols: tuple, start: str, end: str) -> dict:
+    """Total return of each benchmark over the backtest window.
+    
+    Only the first and last close inside the window are read, via index
+    seeks on the OHLCV primary key, for all symbols in one round trip.
+    
+    Returns:
+        Mapping of symbol to total return; symbols without cached prices
+        are omitted
+    """
+    rows = get_db().fetch_many(
+        {
+            symbol: (
+                _BENCHMARK_ENDPOINTS_SQL,
+                (symbol, start, end, symbol, start, end),
+                True,
+            )
+            for symbol in symbols
+        }
+    )
+    return {
+        symbol: (row["end_close"] - row["start_close"]) / row["start_close"]
+        for symbol, row in rows.items()
+        if row and row["start_close"] and row["end_close"] is not None
+    }
+
+
+def _parsed_backtest(backtest: dict) -> dict:
+    """JSON columns of the selected backtest, parsed once per selection.
+    
+    The parsed values live in session state and are reused across reruns
+    until a different backtest is selected.
+    
+    Returns:
+        Dict with ``benchmarks``, ``universe``, ``strategy`` and ``artifacts``
+    """
+    cached = st.session_state.get("results_parsed")
+    if cached and cached[0] == backtest["id"]:
+        return cached[1]
+
+    try:
+        artifacts = json_utils.loads(backtest["artifacts"]) if backtest.get("artifacts") else {}
+    except (TypeError, ValueError):
+        artifacts = {}
+
+    parsed = {
+        "benchmarks": json_utils.loads(backtest["benchmarks"]) if backtest.get("benchmarks") else [],
+        "universe": json_utils.loads(backtest["universe"]),
+        "strategy": json_utils.loads(backtest["strategy_json"]),
+        "artifacts": artifacts,
+    }
+    st.session_state["results_parsed"] = (backtest["id"], parsed)
+    return parsed
+
+
+def _clear_result_caches() -> None:
+    """Drop cached result lookups after backtests are deleted."""
+    _load_backtests.clear()
+    _backtest_options.clear()
+    _load_equity_bundle.clear()
+    _load_trades.clear()
+    clear_backtest_caches()
+    st.session_state.pop("results_parsed", None)
 
 
 def show() -> None:
@@ -19,18 +218,14 @@ def show() -> None:
 
     db = get_db()
     chart_gen = ChartGenerator()
-    stock_mgr = StockDataManager()
 
-    backtests = db.fetchall(
-        """SELECT b.id, s.name as strategy_name, b.status, b.created_at, b.start, b.end,
-                  b.universe, b.benchmarks
-           FROM backtests b
-           JOIN strategies s ON b.strategy_id = s.id
-           WHERE b.status = 'completed'
-           ORDER BY b.created_at DESC"""
+    # Cheap signature query; the full listing is only re-read when it changes
+    signature_row = db.fetchone(
+        "SELECT COUNT(*) AS n, MAX(created_at) AS latest FROM backtests WHERE status = 'completed'"
     )
+    backtest_options = _backtest_options((signature_row["n"], signature_row["latest"]))
 
-    if not backtests:
+    if not backtest_options:
         st.info(t("results.info.no_completed"))
         return
 
@@ -42,10 +237,13 @@ def show() -> None:
     with col_delete_all:
         if st.button("🗑️ Delete All", type="secondary", use_container_width=True, help="Delete all backtest results"):
             if st.session_state.get("confirm_delete_all"):
-                # Perform deletion
-                db.execute("DELETE FROM equity_curves")
-                db.execute("DELETE FROM metrics_run")
-                db.execute("DELETE FROM backtests WHERE status = 'completed'")
+                # Perform deletion of completed runs and their rows in one commit
+                completed = "SELECT id FROM backtests WHERE status = 'completed'"
+                with db.transaction() as tx:
+                    for table in ("trades", "equity_curves", "metrics_run"):
+                        tx.execute(f"DELETE FROM {table} WHERE bt_id IN ({completed})")
+                    tx.execute("DELETE FROM backtests WHERE status = 'completed'")
+                _clear_result_caches()
                 st.success("✅ All backtest results deleted!")
                 st.session_state.pop("confirm_delete_all", None)
                 st.rerun()
@@ -53,18 +251,9 @@ def show() -> None:
                 st.session_state["confirm_delete_all"] = True
                 st.warning("⚠️ Click 'Delete All' again to confirm deletion of all results!")
 
-    default_index = 0
+    option_ids = list(backtest_options.values())
     last_bt = st.session_state.get("last_backtest_id")
-    if last_bt:
-        for idx, bt in enumerate(backtests):
-            if bt["id"] == last_bt:
-                default_index = idx
-                break
-
-    backtest_options = {
-        f"{bt['strategy_name']} - {bt['created_at'][:10]} ({bt['id']})": bt["id"]
-        for bt in backtests
-    }
+    default_index = option_ids.index(last_bt) if last_bt in option_ids else 0
 
     with col_select:
         selected = st.selectbox(
@@ -79,10 +268,12 @@ def show() -> None:
     with col_delete_one:
         if st.button("🗑️ Delete This", type="secondary", use_container_width=True, help="Delete selected backtest result"):
             if st.session_state.get(f"confirm_delete_{bt_id}"):
-                # Perform deletion
-                db.execute("DELETE FROM equity_curves WHERE bt_id = ?", (bt_id,))
-                db.execute("DELETE FROM metrics_run WHERE bt_id = ?", (bt_id,))
-                db.execute("DELETE FROM backtests WHERE id = ?", (bt_id,))
+                # Perform deletion in one commit
+                with db.transaction() as tx:
+                    for table in ("trades", "equity_curves", "metrics_run"):
+                        tx.execute(f"DELETE FROM {table} WHERE bt_id = ?", (bt_id,))
+                    tx.execute("DELETE FROM backtests WHERE id = ?", (bt_id,))
+                _clear_result_caches()
                 st.success(f"✅ Backtest {bt_id} deleted!")
                 st.session_state.pop(f"confirm_delete_{bt_id}", None)
                 st.session_state.pop("last_backtest_id", None)
@@ -91,18 +282,9 @@ def show() -> None:
                 st.session_state[f"confirm_delete_{bt_id}"] = True
                 st.warning(f"⚠️ Click 'Delete This' again to confirm deletion of backtest {bt_id}!")
 
-    backtest = db.fetchone(
-        """SELECT b.*, s.name as strategy_name, s.json as strategy_json
-           FROM backtests b
-           JOIN strategies s ON b.strategy_id = s.id
-           WHERE b.id = ?""",
-        (bt_id,),
-    )
-
-    metrics = db.fetchone(
-        "SELECT * FROM metrics_run WHERE bt_id = ?",
-        (bt_id,),
-    )
+    bundle = load_backtest_bundle(bt_id)
+    backtest = bundle["backtest"]
+    metrics = bundle["metrics"]
 
     if not metrics:
         st.warning(t("results.warning.no_metrics"))
@@ -151,45 +333,33 @@ def show() -> None:
                 f"{cagr * 100:.2f}%" if cagr else "N/A",
             )
 
-    artifacts_raw = backtest.get("artifacts")
-    try:
-        artifacts = json.loads(artifacts_raw) if artifacts_raw else {}
-    except (TypeError, json.JSONDecodeError):
-        artifacts = {}
-
-    trade_log = artifacts.get("trade_log") or []
-
-    equity_tab, metrics_tab, trades_tab, benchmark_tab, details_tab = st.tabs(
-        [
-            t("results.tabs.equity"),
-            t("results.tabs.metrics"),
-            t("results.tabs.trades"),
-            t("results.tabs.benchmark"),
-            t("results.tabs.details"),
-        ]
+    parsed = _parsed_backtest(backtest)
+    artifacts = parsed["artifacts"]
+
+    # Only the selected view is rendered, so other views' data is not loaded
+    view = st.radio(
+        t("results.view.label"),
+        _RESULT_VIEWS,
+        format_func=lambda name: t(f"results.tabs.{name}"),
+        horizontal=True,
+        key="results_view",
+        label_visibility="collapsed",
     )
 
-    with equity_tab:
+    if view == "equity":
         st.subheader(t("results.tabs.equity_header"))
 
-        equity_rows = db.fetchall(
-            """SELECT timestamp, value, cash, pnl, return_pct
-                   FROM equity_curves
-                   WHERE bt_id = ?
-                   ORDER BY timestamp""",
-            (bt_id,),
-        )
+        equity_bundle = _load_equity_bundle(bt_id)
+        equity_df = equity_bundle["equity"]
 
-        if equity_rows:
-            equity_df = pd.DataFrame(equity_rows)
-            equity_df["date"] = pd.to_datetime(equity_df["timestamp"])
-            equity_df.sort_values("date", inplace=True)
-            equity_df["return_pct"] = equity_df["return_pct"].fillna(0.0)
-            equity_df["pnl"] = equity_df["pnl"].fillna(0.0)
+        # Rows arrive in date order from the query's ORDER BY timestamp
+        if not equity_df.empty:
+            # Charts get a shape-preserving subset; statistics below use every row
+            chart_df = lttb_downsample(equity_df)
 
             st.plotly_chart(
                 chart_gen.equity_trend_chart(
-                    equity_df,
+                    chart_df,
                     title=t("results.chart.equity_trend"),
                 ),
                 use_container_width=True,
@@ -197,14 +367,15 @@ def show() -> None:
 
             st.plotly_chart(
                 chart_gen.daily_returns_bar_chart(
-                    equity_df,
+                    chart_df,
                     title=t("results.chart.daily_returns"),
                 ),
                 use_container_width=True,
             )
 
-            total_gain_days = int((equity_df["return_pct"] > 0).sum())
-            total_loss_days = int((equity_df["return_pct"] < 0).sum())
+            sessions = equity_bundle["sessions"]
+            total_gain_days = int(sessions["gains"] or 0)
+            total_loss_days = int(sessions["losses"] or 0)
             st.caption(
                 t(
                     "results.caption.sessions",
@@ -213,54 +384,54 @@ def show() -> None:
                 )
             )
 
-            def _format_gain_loss(df: pd.DataFrame) -> pd.DataFrame:
-                formatted = df.copy()
-                formatted["date"] = formatted["date"].apply(
-                    lambda x: x.strftime("%Y-%m-%d") if pd.notnull(x) else "—"
-                )
-                formatted["return_pct"] = formatted["return_pct"] * 100
-                formatted = formatted[["date", "return_pct", "value", "pnl"]]
-
-                date_col = t("results.gain_loss.date")
-                return_col = t("results.gain_loss.return")
-                value_col = t("results.gain_loss.value")
-                pnl_col = t("results.gain_loss.pnl")
-
-                formatted.rename(
-                    columns={
-                        "date": date_col,
-                        "return_pct": return_col,
-                        "value": value_col,
-                        "pnl": pnl_col,
-                    },
-                    inplace=True,
-                )
-
-                formatted[return_col] = formatted[return_col].map(lambda x: f"{x:.2f}%")
-                formatted[value_col] = formatted[value_col].map(lambda x: f"${x:,.2f}")
-                formatted[pnl_col] = formatted[pnl_col].map(lambda x: f"${x:,.2f}")
-                return formatted
+            # Rows come from SQL as display-ready numbers; st.dataframe
+            # formats them client-side via column_config
+            gain_loss_labels = {
+                "date": t("results.gain_loss.date"),
+                "return_pct": t("results.gain_loss.return"),
+                "value": t("results.gain_loss.value"),
+                "pnl": t("results.gain_loss.pnl"),
+            }
+            gain_loss_config = {
+                gain_loss_labels["date"]: st.column_config.DateColumn(format="YYYY-MM-DD"),
+                gain_loss_labels["return_pct"]: st.column_config.NumberColumn(format="%.2f%%"),
+                gain_loss_labels["value"]: st.column_config.NumberColumn(format="$%.2f"),
+                gain_loss_labels["pnl"]: st.column_config.NumberColumn(format="$%.2f"),
+            }
 
             gain_col, loss_col = st.columns(2)
 
-            top_gains = equity_df.sort_values("return_pct", ascending=False).head(5)
-            if not top_gains.empty:
+            # Top sessions are ranked in SQL rather than sorting the full curve
+            top_gains = equity_bundle["top_gains"]
+            if top_gains:
                 gain_col.markdown(t("results.section.top_gains"))
-                gain_col.dataframe(_format_gain_loss(top_gains), use_container_width=True)
+                gain_col.dataframe(
+                    pd.DataFrame(top_gains)
+                    .assign(date=lambda df: pd.to_datetime(df["date"]))
+                    .rename(columns=gain_loss_labels),
+                    use_container_width=True,
+                    column_config=gain_loss_config,
+                )
             else:
                 gain_col.info(t("results.info.no_gain_sessions"))
 
-            top_losses = equity_df.sort_values("return_pct").head(5)
-            if not top_losses.empty:
+            top_losses = equity_bundle["top_losses"]
+            if top_losses:
                 loss_col.markdown(t("results.section.top_losses"))
-                loss_col.dataframe(_format_gain_loss(top_losses), use_container_width=True)
+                loss_col.dataframe(
+                    pd.DataFrame(top_losses)
+                    .assign(date=lambda df: pd.to_datetime(df["date"]))
+                    .rename(columns=gain_loss_labels),
+                    use_container_width=True,
+                    column_config=gain_loss_config,
+                )
             else:
                 loss_col.info(t("results.info.no_loss_sessions"))
 
         else:
             st.info(t("results.info.no_equity"))
 
-    with metrics_tab:
+    elif view == "metrics":
         st.subheader(t("results.tabs.metrics_header"))
 
         label_map = {
@@ -273,39 +444,36 @@ def show() -> None:
             "excess_return": t("results.metric.excess_return"),
         }
 
-        metrics_rows = []
-        for key, label in label_map.items():
-            if key not in metrics:
-                continue
-            value = metrics.get(key)
-            if value is None:
-                display = "N/A"
-            elif key in {"tot_return", "cagr", "max_dd", "excess_return"}:
-                display = f"{value * 100:.2f}%"
-            else:
-                display = f"{value:.3f}"
-            metrics_rows.append(
-                {
-                    t("results.table.metric"): label,
-                    t("results.table.value"): display,
-                }
-            )
+        metric_col = t("results.table.metric")
+        value_col = t("results.table.value")
+        metrics_rows = [
+            {
+                metric_col: label,
+                value_col: _format_metric(key, metrics[key]),
+            }
+            for key, label in label_map.items()
+            if key in metrics
+        ]
 
         df_metrics = pd.DataFrame(metrics_rows)
         st.dataframe(df_metrics, use_container_width=True)
 
-    with trades_tab:
+    elif view == "trades":
         st.subheader(t("results.tabs.trades_header"))
 
-        if trade_log:
-            trade_df = pd.DataFrame(trade_log)
+        # Stored trades arrive parsed and in execution order
+        trade_df = _load_trades(bt_id)
+        if trade_df.empty:
+            # Backtests recorded before the trades table kept the log in artifacts
+            trade_df = pd.DataFrame(artifacts.get("trade_log") or [])
+            if "timestamp" in trade_df.columns:
+                trade_df["timestamp"] = pd.to_datetime(trade_df["timestamp"], errors="coerce")
+                trade_df.sort_values("timestamp", inplace=True)
+
+        if not trade_df.empty:
             trade_df = trade_df.dropna(how="all")
 
             if not trade_df.empty:
-                if "timestamp" in trade_df.columns:
-                    trade_df["timestamp"] = pd.to_datetime(trade_df["timestamp"], errors="coerce")
-                    trade_df.sort_values("timestamp", inplace=True)
-
                 if "alloc_pct" in trade_df.columns:
                     trade_df["alloc_pct"] = pd.to_numeric(trade_df["alloc_pct"], errors="coerce")
                 else:
@@ -318,26 +486,37 @@ def show() -> None:
                 else:
                     trade_df["portfolio_value"] = pd.NA
 
-                sells = trade_df[trade_df.get("action") == "SELL"].copy()
-                realized_trades = sells.dropna(subset=["pnl"])
-
-                total_trades = int(len(trade_df))
-                realized_pnl = float(realized_trades["pnl"].sum()) if not realized_trades.empty else 0.0
-                win_rate = (
-                    float((realized_trades["pnl"] > 0).mean()) if not realized_trades.empty else None
-                )
-                avg_hold = (
-                    float(realized_trades["holding_period"].dropna().mean())
-                    if not realized_trades.empty
-                    and "holding_period" in realized_trades.columns
-                    and not realized_trades["holding_period"].dropna().empty
-                    else None
+                # One groupby pass yields every per-action aggregate
+                stats_df = trade_df.reindex(columns=["action", "pnl", "holding_period", "alloc_pct"])
+                pnl = pd.to_numeric(stats_df["pnl"], errors="coerce")
+                realized = pnl.notna()
+                action_stats = stats_df.assign(
+                    pnl=pnl,
+                    win=(pnl > 0).astype(float).where(realized),
+                    holding_period=pd.to_numeric(
+                        stats_df["holding_period"], errors="coerce"
+                    ).where(realized),
+                    alloc_pct=pd.to_numeric(stats_df["alloc_pct"], errors="coerce"),
+                ).groupby("action").agg(
+                    realized_count=("pnl", "count"),
+                    pnl_sum=("pnl", "sum"),
+                    win_rate=("win", "mean"),
+                    avg_hold=("holding_period", "mean"),
+                    avg_alloc=("alloc_pct", "mean"),
                 )
 
-                buy_allocations = trade_df[
-                    (trade_df.get("action") == "BUY") & trade_df["alloc_pct"].notna()
-                ]["alloc_pct"]
-                avg_allocation = float(buy_allocations.mean()) if not buy_allocations.empty else None
+                def _action_stat(action: str, column: str):
+                    if action not in action_stats.index:
+                        return None
+                    value = action_stats.at[action, column]
+                    return None if pd.isna(value) else float(value)
+
+                total_trades = int(len(trade_df))
+                realized_count = _action_stat("SELL", "realized_count") or 0
+                realized_pnl = _action_stat("SELL", "pnl_sum") or 0.0
+                win_rate = _action_stat("SELL", "win_rate") if realized_count else None
+                avg_hold = _action_stat("SELL", "avg_hold") if realized_count else None
+                avg_allocation = _action_stat("BUY", "avg_alloc")
 
                 metric_col1, metric_col2, metric_col3, metric_col4 = st.columns(4)
 
@@ -377,38 +556,12 @@ def show() -> None:
                         )
                     )
 
+                # Keep numeric columns numeric; st.dataframe formats them
+                # client-side via column_config and they stay sortable
                 formatted = trade_df.copy()
-                if "timestamp" in formatted.columns:
-                    formatted["timestamp"] = formatted["timestamp"].apply(
-                        lambda x: x.strftime("%Y-%m-%d") if pd.notnull(x) else "—"
-                    )
-
-                if "pnl_pct" in formatted.columns:
-                    formatted["pnl_pct"] = formatted["pnl_pct"].apply(
-                        lambda x: f"{x * 100:.2f}%" if pd.notnull(x) else "—"
-                    )
-
-                if "alloc_pct" in formatted.columns:
-                    formatted["alloc_pct"] = formatted["alloc_pct"].apply(
-                        lambda x: f"{x * 100:.2f}%" if pd.notnull(x) else "—"
-                    )
-
-                money_cols = ["price", "value", "pnl", "commission"]
-                for col in money_cols:
+                for col in ("pnl_pct", "alloc_pct"):
                     if col in formatted.columns:
-                        formatted[col] = formatted[col].apply(
-                            lambda x: f"${x:,.2f}" if pd.notnull(x) else "—"
-                        )
-
-                if "size" in formatted.columns:
-                    formatted["size"] = formatted["size"].apply(
-                        lambda x: int(x) if pd.notnull(x) else "—"
-                    )
-
-                if "holding_period" in formatted.columns:
-                    formatted["holding_period"] = formatted["holding_period"].apply(
-                        lambda x: f"{int(x)}" if pd.notnull(x) else "—"
-                    )
+                        formatted[col] = pd.to_numeric(formatted[col], errors="coerce") * 100
 
                 column_map = {
                     "timestamp": t("results.trades.column.timestamp"),
@@ -425,21 +578,38 @@ def show() -> None:
                     "reason": t("results.trades.column.reason"),
                 }
 
+                column_formats = {
+                    "timestamp": st.column_config.DateColumn(format="YYYY-MM-DD"),
+                    "size": st.column_config.NumberColumn(format="%d"),
+                    "price": st.column_config.NumberColumn(format="$%.2f"),
+                    "value": st.column_config.NumberColumn(format="$%.2f"),
+                    "commission": st.column_config.NumberColumn(format="$%.2f"),
+                    "pnl": st.column_config.NumberColumn(format="$%.2f"),
+                    "pnl_pct": st.column_config.NumberColumn(format="%.2f%%"),
+                    "alloc_pct": st.column_config.NumberColumn(format="%.2f%%"),
+                    "holding_period": st.column_config.NumberColumn(format="%d"),
+                }
+
                 available_columns = [col for col in column_map.keys() if col in formatted.columns]
 
                 st.dataframe(
                     formatted[available_columns].rename(columns=column_map),
                     use_container_width=True,
+                    column_config={
+                        column_map[col]: column_formats[col]
+                        for col in available_columns
+                        if col in column_formats
+                    },
                 )
             else:
                 st.info(t("results.trades.no_data"))
         else:
             st.info(t("results.trades.no_data"))
 
-    with benchmark_tab:
+    elif view == "benchmark":
         st.subheader(t("results.tabs.benchmark_header"))
 
-        benchmarks = json.loads(backtest["benchmarks"]) if backtest.get("benchmarks") else []
+        benchmarks = parsed["benchmarks"]
 
         if benchmarks:
             st.write(t("results.text.benchmarks", benchmarks=", ".join(benchmarks)))
@@ -447,24 +617,17 @@ def show() -> None:
             start_date = backtest["start"]
             end_date = backtest["end"]
 
-            comparison_data = []
             total_return = metrics.get("tot_return", 0)
+            bench_returns = _benchmark_returns(tuple(benchmarks), start_date, end_date)
 
-            for benchmark in benchmarks:
-                bench_data = stock_mgr.get_cached_data(benchmark, start_date, end_date)
-
-                if not bench_data.empty:
-                    start_price = bench_data["close"].iloc[0]
-                    end_price = bench_data["close"].iloc[-1]
-                    bench_return = (end_price - start_price) / start_price
-
-                    comparison_data.append(
-                        {
-                            t("results.benchmark.symbol"): benchmark,
-                            t("results.metric.total_return"): f"{bench_return * 100:.2f}%",
-                            t("results.benchmark.outperformance"): f"{(total_return - bench_return) * 100:.2f}%",
-                        }
-                    )
+            comparison_data = [
+                {
+                    t("results.benchmark.symbol"): benchmark,
+                    t("results.metric.total_return"): f"{bench_return * 100:.2f}%",
+                    t("results.benchmark.outperformance"): f"{(total_return - bench_return) * 100:.2f}%",
+                }
+                for benchmark, bench_return in bench_returns.items()
+            ]
 
             if comparison_data:
                 df_comparison = pd.DataFrame(comparison_data)
@@ -474,7 +637,7 @@ def show() -> None:
         else:
             st.info(t("results.info.no_benchmarks"))
 
-    with details_tab:
+    elif view == "details":
         st.subheader(t("results.section.configuration"))
 
         col1, col2 = st.columns(2)
@@ -486,8 +649,7 @@ def show() -> None:
             st.markdown(t("results.config.created", value=backtest["created_at"]))
 
         with col2:
-            universe = json.loads(backtest["universe"])
-            st.markdown(t("results.config.universe", value=", ".join(universe)))
+            st.markdown(t("results.config.universe", value=", ".join(parsed["universe"])))
             st.markdown(t("results.config.start", value=backtest["start"]))
             st.markdown(t("results.config.end", value=backtest["end"]))
             st.markdown(
@@ -500,7 +662,7 @@ def show() -> None:
         st.divider()
         st.subheader(t("results.section.strategy_definition"))
 
-        strategy_json = json.loads(backtest["strategy_json"])
+        strategy_json = parsed["strategy"]
         st.json(strategy_json)
 
         st.divider()
@@ -510,24 +672,29 @@ def show() -> None:
 
         with exp_col1:
             if st.button(t("results.button.export_json")):
+                # Rows are already plain dicts; orjson handles any numpy scalars
                 export_data = {
-                    "backtest": dict(backtest),
-                    "metrics": dict(metrics) if metrics else {},
+                    "backtest": backtest,
+                    "metrics": metrics or {},
                     "strategy": strategy_json,
                 }
                 st.download_button(
                     t("results.button.download_json"),
-                    data=json.dumps(export_data, indent=2),
+                    data=json_utils.dumps(export_data, indent=True),
                     file_name=f"backtest_{bt_id}.json",
                     mime="application/json",
                 )
 
         with exp_col2:
             if st.button(t("results.button.export_metrics")):
-                df_metrics_export = pd.DataFrame([metrics]) if metrics else pd.DataFrame()
+                # A single row needs no DataFrame; write it with csv directly
+                buffer = io.StringIO()
+                writer = csv.writer(buffer, lineterminator="\n")
+                writer.writerow(metrics.keys())
+                writer.writerow(metrics.values())
                 st.download_button(
                     t("results.button.download_csv"),
-                    data=df_metrics_export.to_csv(index=False),
+                    data=buffer.getvalue(),
                     file_name=f"metrics_{bt_id}.csv",
                     mime="text/csv",
                 )
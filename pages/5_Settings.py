@@ -4,7 +4,34 @@ Settings page for LLM configuration and other app settings.
 import streamlit as st
 from datetime import datetime
 from src.db import get_db
-from src.ui import t, use_language_selector
+from src.ui import (
+    active_llm_config,
+    clear_llm_config_caches,
+    list_llm_configs,
+    t,
+    use_language_selector,
+)
+
+_PROVIDER_LABELS = {
+    "openai": "OpenAI (GPT)",
+    "anthropic": "Anthropic (Claude)",
+}
+
+_MODEL_OPTIONS = {
+    "openai": (
+        "gpt-4-turbo-preview",
+        "gpt-4",
+        "gpt-4-1106-preview",
+        "gpt-3.5-turbo",
+        "gpt-3.5-turbo-16k",
+    ),
+    "anthropic": (
+        "claude-3-5-sonnet-20241022",
+        "claude-3-opus-20240229",
+        "claude-3-sonnet-20240229",
+        "claude-3-haiku-20240307",
+    ),
+}
 
 # Initialize
 use_language_selector()
@@ -18,10 +45,9 @@ db = get_db()
 st.header(t("settings.llm.header"))
 st.write(t("settings.llm.description"))
 
-# Get current active config
-active_config = db.fetchone(
-    "SELECT * FROM llm_configs WHERE is_active = 1"
-)
+# All saved configs; active_llm_config reads the same cached result
+all_configs = list_llm_configs()
+active_config = active_llm_config()
 
 # LLM Configuration Form
 with st.expander(t("settings.llm.add_config"), expanded=not active_config):
@@ -32,70 +58,55 @@ with st.expander(t("settings.llm.add_config"), expanded=not active_config):
     with col1:
         provider = st.selectbox(
             t("settings.llm.provider_label"),
-            options=["openai", "anthropic"],
-            format_func=lambda x: {
-                "openai": "OpenAI (GPT)",
-                "anthropic": "Anthropic (Claude)"
-            }[x],
+            options=list(_PROVIDER_LABELS),
+            format_func=_PROVIDER_LABELS.__getitem__,
             help=t("settings.llm.provider_help"),
             key="provider_select"
         )
     
     with col2:
         # Model options based on provider
-        if provider == "openai":
-            model_options = [
-                "gpt-4-turbo-preview",
-                "gpt-4",
-                "gpt-4-1106-preview",
-                "gpt-3.5-turbo",
-                "gpt-3.5-turbo-16k"
-            ]
-            default_idx = 0
-        else:
-            model_options = [
-                "claude-3-5-sonnet-20241022",
-                "claude-3-opus-20240229",
-                "claude-3-sonnet-20240229",
-                "claude-3-haiku-20240307"
-            ]
-            default_idx = 0
-        
         model = st.selectbox(
             t("settings.llm.model_label"),
-            options=model_options,
-            index=default_idx,
+            options=_MODEL_OPTIONS[provider],
+            index=0,
             help=t("settings.llm.model_help"),
             key="model_select"
         )
     
-    api_key = st.text_input(
-        t("settings.llm.api_key_label"),
-        type="password",
-        help=t("settings.llm.api_key_help"),
-        key="api_key_input"
-    )
-    
-    col_btn1, col_btn2 = st.columns([1, 3])
-    with col_btn1:
-        submitted = st.button(
-            t("settings.llm.save_button"),
-            type="primary",
-            use_container_width=True
+    # Provider and model stay outside the form so the model list follows the
+    # provider; typing the key inside the form does not rerun the page
+    with st.form("llm_config_form", clear_on_submit=False):
+        api_key = st.text_input(
+            t("settings.llm.api_key_label"),
+            type="password",
+            help=t("settings.llm.api_key_help"),
+            key="api_key_input"
         )
+        
+        col_btn1, col_btn2 = st.columns([1, 3])
+        with col_btn1:
+            submitted = st.form_submit_button(
+                t("settings.llm.save_button"),
+                type="primary",
+                use_container_width=True
+            )
     
     if submitted:
         if not api_key:
             st.error(t("settings.llm.api_key_required"))
         else:
-            db.execute("UPDATE llm_configs SET is_active = 0")
             now = datetime.now().isoformat()
-            db.execute(
-                """INSERT INTO llm_configs 
-                   (provider, model, api_key, is_active, created_at, updated_at)
-                   VALUES (?, ?, ?, 1, ?, ?)""",
-                (provider, model, api_key, now, now)
-            )
+            # Deactivate and insert in one commit
+            with db.transaction() as tx:
+                tx.execute("UPDATE llm_configs SET is_active = 0")
+                tx.execute(
+                    """INSERT INTO llm_configs 
+                       (provider, model, api_key, is_active, created_at, updated_at)
+                       VALUES (?, ?, ?, 1, ?, ?)""",
+                    (provider, model, api_key, now, now)
+                )
+            clear_llm_config_caches()
             st.success(t("settings.llm.save_success"))
             st.rerun()
 
@@ -107,23 +118,20 @@ if active_config:
     col1, col2, col3 = st.columns([2, 2, 1])
     
     with col1:
-        provider_display = {
-            "openai": "OpenAI (GPT)",
-            "anthropic": "Anthropic (Claude)"
-        }.get(active_config['provider'], active_config['provider'])
+        provider_display = _PROVIDER_LABELS.get(active_config['provider'], active_config['provider'])
         st.metric(t("settings.llm.provider_label"), provider_display)
     
     with col2:
         st.metric(t("settings.llm.model_label"), active_config['model'])
     
     with col3:
-        masked_key = active_config['api_key'][:8] + "..." + active_config['api_key'][-4:]
-        st.metric(t("settings.llm.api_key_label"), masked_key)
+        st.metric(t("settings.llm.api_key_label"), active_config['masked_key'])
     
     st.caption(t("settings.llm.config_updated", date=active_config['updated_at']))
     
     if st.button(t("settings.llm.delete_button"), type="secondary"):
         db.execute("DELETE FROM llm_configs WHERE id = ?", (active_config['id'],))
+        clear_llm_config_caches()
         st.success(t("settings.llm.delete_success"))
         st.rerun()
 
@@ -131,10 +139,6 @@ if active_config:
 st.divider()
 st.subheader(t("settings.llm.all_configs"))
 
-all_configs = db.fetchall(
-    "SELECT * FROM llm_configs ORDER BY created_at DESC"
-)
-
 if all_configs:
     for config in all_configs:
         with st.expander(
@@ -146,8 +150,7 @@ if all_configs:
             with col1:
                 st.write(f"**{t('settings.llm.provider_label')}:** {config['provider']}")
                 st.write(f"**{t('settings.llm.model_label')}:** {config['model']}")
-                masked_key = config['api_key'][:8] + "..." + config['api_key'][-4:]
-                st.write(f"**{t('settings.llm.api_key_label')}:** {masked_key}")
+                st.write(f"**{t('settings.llm.api_key_label')}:** {config['masked_key']}")
                 st.write(f"**{t('settings.llm.created')}:** {config['created_at']}")
                 status_text = '✅ ' + t('settings.llm.active') if config['is_active'] else t('settings.llm.inactive')
                 st.write(f"**{t('settings.llm.status')}:** {status_text}")
@@ -158,11 +161,13 @@ if all_configs:
                         t("settings.llm.activate_button"),
                         key=f"activate_{config['id']}"
                     ):
-                        db.execute("UPDATE llm_configs SET is_active = 0")
-                        db.execute(
-                            "UPDATE llm_configs SET is_active = 1, updated_at = ? WHERE id = ?",
-                            (datetime.now().isoformat(), config['id'])
-                        )
+                        with db.transaction() as tx:
+                            tx.execute("UPDATE llm_configs SET is_active = 0")
+                            tx.execute(
+                                "UPDATE llm_configs SET is_active = 1, updated_at = ? WHERE id = ?",
+                                (datetime.now().isoformat(), config['id'])
+                            )
+                        clear_llm_config_caches()
                         st.success(t("settings.llm.activate_success"))
                         st.rerun()
                 
@@ -172,6 +177,7 @@ if all_configs:
                     type="secondary"
                 ):
                     db.execute("DELETE FROM llm_configs WHERE id = ?", (config['id'],))
+                    clear_llm_config_caches()
                     st.success(t("settings.llm.delete_success"))
                     st.rerun()
 else:
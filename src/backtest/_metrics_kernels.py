@@ -0,0 +1,114 @@
+"""
+Numeric kernels behind MetricsCalculator.
+Compiled with numba when it is installed; otherwise the same functions run
+as plain NumPy, except max drawdown which switches to a vectorized form.
+"""
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - optional dependency
+    njit = None
+
+
+def pct_change_kernel(values: np.ndarray) -> np.ndarray:
+    """Simple returns between consecutive values.
+    
+    Args:
+        values: float64 array of portfolio values
+    
+    Returns:
+        Array one element shorter than values
+    """
+    return values[1:] / values[:-1] - 1.0
+
+
+def sharpe_kernel(returns: np.ndarray, daily_rf: float, sqrt_ann: float) -> float:
+    """Annualized Sharpe ratio of daily returns.
+    
+    Args:
+        returns: float64 array of daily returns
+        daily_rf: Daily risk-free rate
+        sqrt_ann: Square root of the periods per year
+    
+    Returns:
+        Sharpe ratio, or 0.0 when it is undefined
+    """
+    n = returns.shape[0]
+    if n < 2:
+        return 0.0
+    excess = returns - daily_rf
+    mean = excess.mean()
+    std = np.sqrt(((excess - mean) ** 2).sum() / (n - 1))
+    if std == 0.0:
+        return 0.0
+    return mean / std * sqrt_ann
+
+
+def sortino_kernel(returns: np.ndarray, daily_rf: float, sqrt_ann: float) -> float:
+    """Annualized Sortino ratio of daily returns.
+    
+    Args:
+        returns: float64 array of daily returns
+        daily_rf: Daily risk-free rate
+        sqrt_ann: Square root of the periods per year
+    
+    Returns:
+        Sortino ratio, or 0.0 when it is undefined
+    """
+    downside = returns[returns < daily_rf]
+    n = downside.shape[0]
+    if n < 2:
+        return 0.0
+    downside_mean = downside.mean()
+    downside_std = np.sqrt(((downside - downside_mean) ** 2).sum() / (n - 1))
+    if downside_std == 0.0:
+        return 0.0
+    return (returns.mean() - daily_rf) / downside_std * sqrt_ann
+
+
+def _max_drawdown_loop(values: np.ndarray) -> float:
+    """Single pass over values tracking the running peak.
+    
+    A bar that sets a new peak has zero drawdown, so the division only
+    happens on bars below the peak.
+    """
+    peak = values[0]
+    worst = 0.0
+    for i in range(1, values.shape[0]):
+        value = values[i]
+        if value > peak:
+            peak = value
+        else:
+            drawdown = (value - peak) / peak
+            if drawdown < worst:
+                worst = drawdown
+    return worst
+
+
+def _max_drawdown_numpy(values: np.ndarray) -> float:
+    """Vectorized equivalent of _max_drawdown_loop.
+    
+    The division happens in place, so only two temporaries of
+    len(values) are allocated.
+    """
+    peak = np.maximum.accumulate(values)
+    drawdown = values - peak
+    drawdown /= peak
+    return float(drawdown.min())
+
+
+if njit is not None:
+    pct_change_kernel = njit(cache=True)(pct_change_kernel)
+    sharpe_kernel = njit(cache=True)(sharpe_kernel)
+    sortino_kernel = njit(cache=True)(sortino_kernel)
+    max_drawdown_kernel = njit(cache=True)(_max_drawdown_loop)
+
+    # Compile (or load from the on-disk cache) at import so the first
+    # backtest does not pay for it
+    _warmup = np.array([1.0, 1.0])
+    sharpe_kernel(pct_change_kernel(_warmup), 0.0, 1.0)
+    sortino_kernel(_warmup, 0.0, 1.0)
+    max_drawdown_kernel(_warmup)
+else:
+    max_drawdown_kernel = _max_drawdown_numpy
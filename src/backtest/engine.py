@@ -3,81 +3,307 @@ Backtrader execution engine.
 Runs strategies with Backtrader, configures cerebro, applies costs.
 """
 import backtrader as bt
+import csv
+import multiprocessing
+import numpy as np
 import pandas as pd
+from backtrader.utils import date2num
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
-from typing import Dict, Any, Optional, List
-import json
+from functools import lru_cache
+from itertools import repeat
+from types import CodeType
+from typing import Dict, Any, Optional, List, Set, Union
 import os
 from src.data import StockDataManager, IndicatorStorage
-from src.db import get_db
+from src.db import Database, get_db
 from src import config
 
 
+# Backtrader date numbers count days from 0001-01-01 (ordinal 1)
+_UNIX_EPOCH_DATENUM = 719163.0
+
+
 class EquityCurveAnalyzer(bt.Analyzer):
-    """Collect portfolio value over time during a backtest."""
+    """Collect portfolio value over time during a backtest.
+    
+    next() only writes the bar's date number, value and cash into
+    preallocated arrays; timestamps, pnl and returns are derived in one
+    vectorized pass when the records are requested.
+    """
 
     def __init__(self):
         super().__init__()
-        self.records: List[Dict[str, Any]] = []
-        self.prev_value: Optional[float] = None
         self.starting_value: Optional[float] = None
+        self._size = 0
 
     def start(self):
-        self.records = []
-        self.prev_value = None
-        self.starting_value = float(self.strategy.broker.getvalue())
+        # Feeds are preloaded, so the longest one bounds the bar count;
+        # _append still grows the arrays should the clock run longer
+        capacity = max((data.buflen() for data in self.strategy.datas), default=0)
+        self._datenums = np.empty(max(capacity, 1), dtype='f8')
+        self._values = np.empty_like(self._datenums)
+        self._cash = np.empty_like(self._datenums)
+        self._size = 0
+        # Bound once so next() does no attribute walks through the strategy
+        self._datetime = self.strategy.datetime
+        self._getvalue = self.strategy.broker.getvalue
+        self._getcash = self.strategy.broker.getcash
+        self.starting_value = float(self._getvalue())
 
     def next(self):
-        try:
-            dt = self.strategy.datetime.datetime(0)
-        except AttributeError:
-            dt = None
-
-        if dt is None:
-            try:
-                dt = self.strategy.datetime.date(0)
-            except AttributeError:
-                dt = None
-
-        if dt is None:
-            return
-
-        if hasattr(dt, "to_pydatetime"):
-            dt = dt.to_pydatetime()
-
-        if hasattr(dt, "replace"):
-            dt = dt.replace(tzinfo=None)
-
-        value = float(self.strategy.broker.getvalue())
-        cash = float(self.strategy.broker.getcash())
-        starting = self.starting_value or value
-        pnl = value - starting
-        if self.prev_value is None or self.prev_value == 0:
-            ret = 0.0
-        else:
-            ret = (value / self.prev_value) - 1.0
+        i = self._size
+        if i == len(self._values):
+            self._datenums = np.resize(self._datenums, 2 * i)
+            self._values = np.resize(self._values, 2 * i)
+            self._cash = np.resize(self._cash, 2 * i)
+        self._datenums[i] = self._datetime[0]
+        self._values[i] = self._getvalue()
+        self._cash[i] = self._getcash()
+        self._size = i + 1
 
-        self.records.append({
-            "timestamp": dt.isoformat() if hasattr(dt, "isoformat") else str(dt),
-            "value": value,
-            "cash": cash,
-            "pnl": pnl,
-            "return_pct": ret,
-        })
+    def get_arrays(self) -> Dict[str, np.ndarray]:
+        """Recorded samples as column arrays.
+        
+        Returns:
+            Dictionary with ``timestamp`` (ISO strings), ``value``, ``cash``,
+            ``pnl`` and ``return_pct`` arrays of equal length
+        """
+        n = self._size
+        values = self._values[:n]
+        
+        micros = np.rint((self._datenums[:n] - _UNIX_EPOCH_DATENUM) * 86_400_000_000)
+        timestamps = np.datetime_as_string(micros.astype('datetime64[us]'), unit='s')
+        
+        returns = np.zeros(n)
+        if n > 1:
+            prev = values[:-1]
+            nonzero = prev != 0
+            returns[1:][nonzero] = values[1:][nonzero] / prev[nonzero] - 1.0
+        
+        starting = self.starting_value or (values[0] if n else 0.0)
+        return {
+            "timestamp": timestamps,
+            "value": values,
+            "cash": self._cash[:n],
+            "pnl": values - starting,
+            "return_pct": returns,
+        }
 
-        self.prev_value = value
+    @staticmethod
+    def records(arrays: Dict[str, np.ndarray]) -> List[Dict[str, Any]]:
+        """Turn get_arrays() output into one dict per sample.
+        
+        Args:
+            arrays: Column arrays from get_arrays
+            
+        Returns:
+            List of records with timestamp, value, cash, pnl and return_pct
+        """
+        return [
+            {
+                "timestamp": ts,
+                "value": value,
+                "cash": cash,
+                "pnl": pnl,
+                "return_pct": ret,
+            }
+            for ts, value, cash, pnl, ret in zip(
+                arrays["timestamp"].tolist(),
+                arrays["value"].tolist(),
+                arrays["cash"].tolist(),
+                arrays["pnl"].tolist(),
+                arrays["return_pct"].tolist(),
+            )
+        ]
 
     def get_analysis(self):
-        return self.records
+        return self.records(self.get_arrays())
+
+
+# Result analyzers run_backtest can attach: name -> (analyzer, extractor name)
+_ANALYZERS = {
+    'returns': (bt.analyzers.Returns, '_extract_returns'),
+    'sharpe': (bt.analyzers.SharpeRatio, '_extract_sharpe'),
+    'drawdown': (bt.analyzers.DrawDown, '_extract_drawdown'),
+    'trades': (bt.analyzers.TradeAnalyzer, '_extract_trades'),
+}
+
+
+class EquityCsvWriter(bt.Observer):
+    """Stream portfolio value to an open CSV file, one row per bar.
+    
+    Rows are written as the backtest runs, so memory use does not grow
+    with the number of bars. The caller owns the file and closes it.
+    """
+
+    lines = ('value',)
+    params = (('file', None),)
+    plotinfo = dict(plot=False)
+
+    def start(self):
+        self._writer = csv.writer(self.p.file, lineterminator="\n")
+        self._writer.writerow(["date", "value"])
+
+    def next(self):
+        value = self._owner.broker.getvalue()
+        self.lines.value[0] = value
+        self._writer.writerow([self.data.datetime.date(0).isoformat(), value])
+
+
+@lru_cache(maxsize=128)
+def _strategy_class(code: Union[str, CodeType]) -> type:
+    """Execute strategy code and return the Backtrader strategy class it defines.
+    
+    Cached on the source text (or code object), so re-running the same
+    strategy skips parsing and exec. Strategies keep their run state on the
+    instance, which makes sharing the class between runs safe. A module-level
+    ``_STRATEGY`` name selects the class; otherwise the first Strategy
+    subclass defined is used.
+    
+    Args:
+        code: Python code string or compiled code object
+        
+    Returns:
+        Strategy class
+    """
+    # Create namespace for exec
+    namespace = {'bt': bt}
+    
+    # Execute code to define strategy class
+    exec(code, namespace)
+    
+    # Code may name its strategy explicitly, which skips the scan and
+    # picks the right class when helper Strategy subclasses are defined
+    strategy = namespace.get('_STRATEGY')
+    if isinstance(strategy, type) and issubclass(strategy, bt.Strategy):
+        return strategy
+    
+    # Find and return the strategy class
+    for name, obj in namespace.items():
+        if isinstance(obj, type) and issubclass(obj, bt.Strategy) and obj != bt.Strategy:
+            return obj
+    
+    raise ValueError("No valid Backtrader strategy class found in code")
+
+
+class ArrayPandasData(bt.feeds.PandasData):
+    """PandasData feed that loads bars from NumPy arrays.
+    
+    The stock feed reads every field of every bar with ``DataFrame.iloc``.
+    Here each mapped column is converted once in ``start()`` to a float
+    array (missing values become NaN), and ``_load()`` only indexes them.
+    The ``precision`` param sets the array dtype; ``'float32'`` halves the
+    memory the staged columns occupy at the cost of price precision.
+    """
+
+    params = (('precision', 'float64'),)
+
+    def start(self):
+        super().start()
+
+        frame = self.p.dataname
+        self._arrays = []
+        for datafield in self.getlinealiases():
+            if datafield == 'datetime':
+                continue
+            colindex = self._colmapping[datafield]
+            if colindex is None:
+                continue
+            values = frame.iloc[:, colindex].to_numpy(dtype=self.p.precision, na_value=np.nan)
+            self._arrays.append((getattr(self.lines, datafield), values))
+
+        coldtime = self._colmapping['datetime']
+        stamps = pd.DatetimeIndex(frame.index if coldtime is None else frame.iloc[:, coldtime])
+        if stamps.tz is None and (stamps == stamps.normalize()).all():
+            # Daily bars: the date number is the day's ordinal, so the whole
+            # column converts in one step
+            days = stamps.to_numpy().astype('datetime64[D]').astype('i8')
+            self._dtnums = days + _UNIX_EPOCH_DATENUM
+        else:
+            self._dtnums = [date2num(stamp.to_pydatetime()) for stamp in stamps]
+
+    def _load(self):
+        self._idx += 1
+
+        if self._idx >= len(self._dtnums):
+            # exhausted all rows
+            return False
+
+        for line, values in self._arrays:
+            line[0] = values[self._idx]
+
+        self.lines.datetime[0] = self._dtnums[self._idx]
+        return True
+
+
+# Extra lines exposed on every feed: stored indicators plus the optional
+# precompute_signals output
+INDICATOR_LINES = (
+    'sma_20', 'sma_50', 'sma_200', 'ema_12', 'ema_26', 'rsi_14',
+    'macd', 'macd_signal', 'macd_histogram',
+    'bb_upper', 'bb_middle', 'bb_lower', 'signal',
+)
+
+
+class IndicatorDataFeed(ArrayPandasData):
+    """Array-backed feed carrying the indicator lines.
+    
+    Defined once at import; Backtrader's metaclass builds the line and
+    param machinery per class, so a per-call class would redo that work
+    for every symbol. Indicator params default to None (column absent).
+    """
+
+    lines = INDICATOR_LINES
+    params = tuple((line, None) for line in INDICATOR_LINES)
+
+
+def _get(analysis: Any, *keys: str, default: Any = 0.0) -> Any:
+    """Walk nested analyzer results with dict lookups.
+    
+    Args:
+        analysis: Analyzer result (dict-like)
+        *keys: Path of keys to follow
+        default: Value returned when the path is missing or None
+        
+    Returns:
+        The value at the path, or default
+    """
+    for key in keys:
+        analysis = analysis.get(key) if isinstance(analysis, dict) else None
+    return default if analysis is None else analysis
+
+
+def _run_backtest_job(db_path: str, job: Dict[str, Any]) -> Dict[str, Any]:
+    """Process-pool entry point: run one backtest on a fresh engine.
+    
+    Args:
+        db_path: Database file of the engine that submitted the batch
+        job: Keyword arguments for BacktestEngine.run_backtest
+        
+    Returns:
+        The run_backtest result dictionary
+    """
+    db = Database(db_path)
+    try:
+        return BacktestEngine(db).run_backtest(**job)
+    finally:
+        db.close()
 
 
 class BacktestEngine:
     """Execute backtests using Backtrader."""
     
-    def __init__(self):
-        self.stock_manager = StockDataManager()
-        self.indicator_storage = IndicatorStorage()
-        self.db = get_db()
+    def __init__(self, db: Optional[Database] = None):
+        """Initialize the engine.
+        
+        Args:
+            db: Database to read prices from and write results to.
+                Defaults to the shared instance from get_db().
+        """
+        self.db = db or get_db()
+        self.stock_manager = StockDataManager(self.db)
+        self.indicator_storage = IndicatorStorage(self.db)
     
     def run_backtest(
         self,
@@ -89,10 +315,20 @@ class BacktestEngine:
         commission: float = 0.005,
         slippage_bps: float = 5.0,
         backtest_id: Optional[str] = None,
-        capture_equity: bool = True
+        capture_equity: bool = True,
+        strategy_code_obj: Optional[CodeType] = None,
+        equity_csv_path: Optional[str] = None,
+        precision: str = 'float64',
+        analyzers: Optional[Set[str]] = None
     ) -> Dict[str, Any]:
         """Run a backtest with given strategy code.
         
+        A strategy class may define a ``precompute_signals(df)`` classmethod
+        or staticmethod. It is called once per symbol with the OHLCV +
+        indicator frame and must return a numeric Series or array aligned
+        with it; the values are exposed to the strategy as the
+        ``self.data.signal`` line, so next() only has to act on them.
+        
         Args:
             strategy_code: Python code defining Backtrader strategy
             universe: List of symbols to trade
@@ -101,6 +337,14 @@ class BacktestEngine:
             initial_cash: Initial capital
             commission: Commission per share
             slippage_bps: Slippage in basis points
+            strategy_code_obj: Precompiled strategy code; used instead of
+                strategy_code when given
+            equity_csv_path: If given, the equity curve is streamed to this
+                CSV file (date, value) while the backtest runs
+            precision: Float dtype used to stage feed columns, 'float64'
+                or 'float32'
+            analyzers: Names of the result analyzers to attach ('returns',
+                'sharpe', 'drawdown', 'trades'); all of them when None
             
         Returns:
             Dictionary with results
@@ -118,18 +362,44 @@ class BacktestEngine:
         slippage_pct = slippage_bps / 10000.0
         cerebro.broker.set_slippage_perc(slippage_pct)
         
-        # Load and add data feeds for each symbol
+        # Compile the strategy before building feeds so that an optional
+        # precompute_signals hook can add its signal column to each frame
+        try:
+            strategy_class = self._compile_strategy(
+                strategy_code_obj if strategy_code_obj is not None else strategy_code
+            )
+        except Exception as e:
+            return {
+                "success": False,
+                "error": f"Strategy compilation failed: {str(e)}"
+            }
+        precompute_signals = getattr(strategy_class, "precompute_signals", None)
+        
+        # Load OHLCV + indicator data for the whole universe in one query
+        frames = self.indicator_storage.get_indicators_with_ohlcv_bulk(universe, start, end)
+        
+        # Add feeds in universe order so datas[0] stays the first symbol
         data_feeds_loaded = 0
         for symbol in universe:
-            # Get OHLCV data with indicators
-            df = self.indicator_storage.get_indicators_with_ohlcv(symbol, start, end)
+            df = frames.get(symbol)
             
-            if df.empty:
+            if df is None or df.empty:
                 print(f"Warning: No data for {symbol}, skipping")
                 continue
             
+            # Vectorized signals are computed once per symbol here instead
+            # of bar by bar in next(); the strategy reads self.data.signal
+            if precompute_signals is not None:
+                try:
+                    df = df.assign(signal=precompute_signals(df))
+                except Exception as e:
+                    return {
+                        "success": False,
+                        "error": f"Signal precomputation failed for {symbol}: {str(e)}"
+                    }
+            
             # Convert DataFrame to Backtrader data feed
-            data = self._create_data_feed(df, symbol)
+            data = self._create_data_feed(df, symbol, precision)
             if data is not None:
                 cerebro.adddata(data, name=symbol)
                 data_feeds_loaded += 1
@@ -140,28 +410,27 @@ class BacktestEngine:
                 "error": "No data feeds could be loaded"
             }
         
-        # Compile and add strategy
-        try:
-            strategy_class = self._compile_strategy(strategy_code)
-            cerebro.addstrategy(strategy_class)
-        except Exception as e:
-            return {
-                "success": False,
-                "error": f"Strategy compilation failed: {str(e)}"
-            }
+        cerebro.addstrategy(strategy_class)
         
         # Add analyzers
         if capture_equity:
             cerebro.addanalyzer(EquityCurveAnalyzer, _name='equity_curve')
-        cerebro.addanalyzer(bt.analyzers.Returns, _name='returns')
-        cerebro.addanalyzer(bt.analyzers.SharpeRatio, _name='sharpe')
-        cerebro.addanalyzer(bt.analyzers.DrawDown, _name='drawdown')
-        cerebro.addanalyzer(bt.analyzers.TradeAnalyzer, _name='trades')
+        enabled = [name for name in _ANALYZERS if analyzers is None or name in analyzers]
+        for name in enabled:
+            cerebro.addanalyzer(_ANALYZERS[name][0], _name=name)
+        
+        equity_file = None
+        if equity_csv_path:
+            equity_file = open(equity_csv_path, "w", newline="", buffering=1 << 16)
+            cerebro.addobserver(EquityCsvWriter, file=equity_file)
         
         # Run backtest
         try:
             starting_value = cerebro.broker.getvalue()
-            results = cerebro.run()
+            # preload/runonce are Backtrader's defaults but stated here
+            # since the vectorized indicator pass depends on them; the
+            # standard observers only feed plots, which are never drawn
+            results = cerebro.run(preload=True, runonce=True, stdstats=False)
             ending_value = cerebro.broker.getvalue()
             
             # Extract strategy and analyzers
@@ -169,15 +438,17 @@ class BacktestEngine:
             
             equity_records: List[Dict[str, Any]] = []
             if capture_equity:
-                equity_records = strat.analyzers.equity_curve.get_analysis()
-                if backtest_id and equity_records:
-                    self._store_equity_curve(backtest_id, equity_records)
+                equity_analyzer = strat.analyzers.equity_curve
+                equity_arrays = equity_analyzer.get_arrays()
+                if backtest_id and len(equity_arrays["value"]):
+                    self._store_equity_curve(backtest_id, equity_arrays)
+                equity_records = EquityCurveAnalyzer.records(equity_arrays)
 
             trade_log: List[Dict[str, Any]] = []
             if hasattr(strat, 'trade_log'):
                 trade_log = list(strat.trade_log)
             if backtest_id:
-                self._update_backtest_artifacts(backtest_id, trade_log)
+                self._store_trades(backtest_id, trade_log)
 
             return {
                 "success": True,
@@ -185,10 +456,8 @@ class BacktestEngine:
                 "ending_value": ending_value,
                 "total_return": (ending_value - starting_value) / starting_value,
                 "analyzers": {
-                    "returns": self._extract_returns(strat.analyzers.returns),
-                    "sharpe": self._extract_sharpe(strat.analyzers.sharpe),
-                    "drawdown": self._extract_drawdown(strat.analyzers.drawdown),
-                    "trades": self._extract_trades(strat.analyzers.trades)
+                    name: getattr(self, _ANALYZERS[name][1])(getattr(strat.analyzers, name))
+                    for name in enabled
                 },
                 "equity_curve": equity_records,
                 "trade_log": trade_log,
@@ -199,106 +468,132 @@ class BacktestEngine:
                 "success": False,
                 "error": f"Backtest execution failed: {str(e)}"
             }
+        
+        finally:
+            if equity_file is not None:
+                equity_file.close()
 
-    def _store_equity_curve(self, bt_id: str, equity_records: List[Dict[str, Any]]):
-        """Persist equity curve samples for a completed backtest."""
-        conn = self.db.connect()
-        cursor = conn.cursor()
-        rows = [
-            (
-                bt_id,
-                record.get("timestamp"),
-                record.get("value"),
-                record.get("cash"),
-                record.get("pnl"),
-                record.get("return_pct"),
-            )
-            for record in equity_records
-            if record.get("timestamp") is not None
+    def run_backtest_batch(
+        self,
+        jobs: List[Dict[str, Any]],
+        max_workers: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """Run independent backtests in parallel worker processes.
+        
+        Backtrader is CPU-bound and holds the GIL, so each job gets its own
+        process, engine and connection to this engine's database file. Only
+        the database path and job arguments (strategy source, universe,
+        dates, ...) cross the process boundary.
+        
+        Args:
+            jobs: One dict of run_backtest keyword arguments per backtest;
+                strategy_code_obj is ignored since code objects cannot be
+                pickled
+            max_workers: Process count; defaults to min(len(jobs), CPU count)
+            
+        Returns:
+            Result dictionaries in the same order as jobs
+        """
+        jobs = [
+            {key: value for key, value in job.items() if key != "strategy_code_obj"}
+            for job in jobs
         ]
+        
+        if len(jobs) <= 1:
+            return [self.run_backtest(**job) for job in jobs]
+        
+        workers = max_workers or min(len(jobs), os.cpu_count() or 1)
+        # spawn avoids forking the host process's threads and open connection
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+            return list(executor.map(_run_backtest_job, repeat(self.db.db_path), jobs))
 
-        if not rows:
-            return
+    def _store_equity_curve(self, bt_id: str, equity_arrays: Dict[str, np.ndarray]):
+        """Persist equity curve samples for a completed backtest.
+        
+        Args:
+            bt_id: Backtest identifier
+            equity_arrays: Column arrays from EquityCurveAnalyzer.get_arrays
+        """
+        # Columns go straight from the arrays to executemany, which binds
+        # every row inside a single transaction
+        rows = zip(
+            repeat(bt_id),
+            equity_arrays["timestamp"].tolist(),
+            equity_arrays["value"].tolist(),
+            equity_arrays["cash"].tolist(),
+            equity_arrays["pnl"].tolist(),
+            equity_arrays["return_pct"].tolist(),
+        )
 
-        cursor.executemany(
+        self.db.executemany(
             """INSERT OR REPLACE INTO equity_curves
                    (bt_id, timestamp, value, cash, pnl, return_pct)
                    VALUES (?, ?, ?, ?, ?, ?)""",
             rows
         )
-        conn.commit()
-
-    def _update_backtest_artifacts(self, bt_id: str, trade_log: List[Dict[str, Any]]):
-        """Update backtest artifacts with captured trade log."""
-        conn = self.db.connect()
-        cursor = conn.cursor()
-
-        existing = cursor.execute(
-            "SELECT artifacts FROM backtests WHERE id = ?",
-            (bt_id,),
-        ).fetchone()
-
-        artifacts: Dict[str, Any] = {}
-        if existing:
-            raw = existing[0] if isinstance(existing, tuple) else existing[0]
-            if isinstance(existing, dict):
-                raw = existing.get('artifacts')
-            if raw:
-                try:
-                    artifacts = json.loads(raw)
-                except Exception:
-                    artifacts = {}
 
-        artifacts['trade_log'] = trade_log
+    def _store_trades(self, bt_id: str, trade_log: List[Dict[str, Any]]):
+        """Persist the captured trade log as rows of the trades table."""
+        rows = [
+            (
+                bt_id,
+                seq,
+                record.get("timestamp"),
+                record.get("symbol"),
+                record.get("action"),
+                record.get("size"),
+                record.get("price"),
+                record.get("value"),
+                record.get("commission"),
+                record.get("pnl"),
+                record.get("pnl_pct"),
+                record.get("alloc_pct"),
+                record.get("portfolio_value"),
+                record.get("holding_period"),
+                record.get("reason"),
+            )
+            for seq, record in enumerate(trade_log)
+        ]
 
-        cursor.execute(
-            "UPDATE backtests SET artifacts = ? WHERE id = ?",
-            (json.dumps(artifacts), bt_id),
-        )
-        conn.commit()
+        # Replace any earlier rows for this backtest in a single commit
+        with self.db.transaction() as cursor:
+            cursor.execute("DELETE FROM trades WHERE bt_id = ?", (bt_id,))
+            if rows:
+                cursor.executemany(
+                    """INSERT INTO trades
+                           (bt_id, seq, timestamp, symbol, action, size, price, value,
+                            commission, pnl, pnl_pct, alloc_pct, portfolio_value,
+                            holding_period, reason)
+                           VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                    rows
+                )
     
-    def _create_data_feed(self, df: pd.DataFrame, name: str) -> Optional[bt.feeds.PandasData]:
+    def _create_data_feed(
+        self,
+        df: pd.DataFrame,
+        name: str,
+        precision: str = 'float64'
+    ) -> Optional[bt.feeds.PandasData]:
         """Create Backtrader data feed from DataFrame with indicators.
         
         Args:
-            df: DataFrame with OHLCV + indicator data
+            df: DataFrame with OHLCV + indicator data, indexed by datetime
             name: Symbol name
+            precision: Float dtype used to stage the feed's columns
             
         Returns:
             Backtrader data feed or None
         """
         try:
-            # Ensure date is datetime and set as index
-            if 'date' in df.columns:
-                df['date'] = pd.to_datetime(df['date'])
-                df.set_index('date', inplace=True)
-            
-            # Sort by date
-            df.sort_index(inplace=True)
+            # Frames from the data layer arrive sorted; only sort stragglers
+            if not df.index.is_monotonic_increasing:
+                df = df.sort_index()
             
-            # Define custom data feed class that includes indicators
-            class IndicatorDataFeed(bt.feeds.PandasData):
-                # Add indicator lines
-                lines = ('sma_20', 'sma_50', 'sma_200', 'ema_12', 'ema_26', 'rsi_14',
-                        'macd', 'macd_signal', 'macd_histogram',
-                        'bb_upper', 'bb_middle', 'bb_lower',)
-                
-                params = (
-                    ('sma_20', -1),
-                    ('sma_50', -1),
-                    ('sma_200', -1),
-                    ('ema_12', -1),
-                    ('ema_26', -1),
-                    ('rsi_14', -1),
-                    ('macd', -1),
-                    ('macd_signal', -1),
-                    ('macd_histogram', -1),
-                    ('bb_upper', -1),
-                    ('bb_middle', -1),
-                    ('bb_lower', -1),
-                )
+            # Only columns the frame has are mapped; the other indicator
+            # lines stay NaN
+            columns = {line: line for line in INDICATOR_LINES if line in df.columns}
             
-            # Create data feed with indicators
             data = IndicatorDataFeed(
                 dataname=df,
                 datetime=None,  # Use index
@@ -308,18 +603,8 @@ class BacktestEngine:
                 close='close',
                 volume='volume',
                 openinterest=-1,
-                sma_20='sma_20' if 'sma_20' in df.columns else -1,
-                sma_50='sma_50' if 'sma_50' in df.columns else -1,
-                sma_200='sma_200' if 'sma_200' in df.columns else -1,
-                ema_12='ema_12' if 'ema_12' in df.columns else -1,
-                ema_26='ema_26' if 'ema_26' in df.columns else -1,
-                rsi_14='rsi_14' if 'rsi_14' in df.columns else -1,
-                macd='macd' if 'macd' in df.columns else -1,
-                macd_signal='macd_signal' if 'macd_signal' in df.columns else -1,
-                macd_histogram='macd_histogram' if 'macd_histogram' in df.columns else -1,
-                bb_upper='bb_upper' if 'bb_upper' in df.columns else -1,
-                bb_middle='bb_middle' if 'bb_middle' in df.columns else -1,
-                bb_lower='bb_lower' if 'bb_lower' in df.columns else -1,
+                precision=precision,
+                **columns,
             )
             
             return data
@@ -328,27 +613,16 @@ class BacktestEngine:
             print(f"Error creating data feed for {name}: {e}")
             return None
     
-    def _compile_strategy(self, code: str):
+    def _compile_strategy(self, code: Union[str, CodeType]):
         """Compile strategy code into executable class.
         
         Args:
-            code: Python code string
+            code: Python code string or compiled code object
             
         Returns:
             Strategy class
         """
-        # Create namespace for exec
-        namespace = {'bt': bt}
-        
-        # Execute code to define strategy class
-        exec(code, namespace)
-        
-        # Find and return the strategy class
-        for name, obj in namespace.items():
-            if isinstance(obj, type) and issubclass(obj, bt.Strategy) and obj != bt.Strategy:
-                return obj
-        
-        raise ValueError("No valid Backtrader strategy class found in code")
+        return _strategy_class(code)
     
     def _extract_returns(self, analyzer) -> dict:
         """Extract returns analysis.
@@ -359,14 +633,11 @@ class BacktestEngine:
         Returns:
             Dictionary with returns metrics
         """
-        try:
-            analysis = analyzer.get_analysis()
-            return {
-                "total_return": analysis.get('rtot', 0.0),
-                "avg_return": analysis.get('ravg', 0.0)
-            }
-        except:
-            return {}
+        analysis = analyzer.get_analysis()
+        return {
+            "total_return": _get(analysis, 'rtot'),
+            "avg_return": _get(analysis, 'ravg')
+        }
     
     def _extract_sharpe(self, analyzer) -> dict:
         """Extract Sharpe ratio.
@@ -377,13 +648,10 @@ class BacktestEngine:
         Returns:
             Dictionary with Sharpe ratio
         """
-        try:
-            analysis = analyzer.get_analysis()
-            return {
-                "sharpe_ratio": analysis.get('sharperatio', 0.0)
-            }
-        except:
-            return {}
+        analysis = analyzer.get_analysis()
+        return {
+            "sharpe_ratio": _get(analysis, 'sharperatio')
+        }
     
     def _extract_drawdown(self, analyzer) -> dict:
         """Extract drawdown metrics.
@@ -394,14 +662,11 @@ class BacktestEngine:
         Returns:
             Dictionary with drawdown metrics
         """
-        try:
-            analysis = analyzer.get_analysis()
-            return {
-                "max_drawdown": analysis.get('max', {}).get('drawdown', 0.0),
-                "max_drawdown_pct": analysis.get('max', {}).get('drawdown', 0.0) / 100.0
-            }
-        except:
-            return {}
+        max_drawdown = _get(analyzer.get_analysis(), 'max', 'drawdown')
+        return {
+            "max_drawdown": max_drawdown,
+            "max_drawdown_pct": max_drawdown / 100.0
+        }
     
     def _extract_trades(self, analyzer) -> dict:
         """Extract trade statistics.
@@ -412,23 +677,9 @@ class BacktestEngine:
         Returns:
             Dictionary with trade stats
         """
-        try:
-            analysis = analyzer.get_analysis()
-            return {
-                "total_trades": analysis.get('total', {}).get('total', 0),
-                "won_trades": analysis.get('won', {}).get('total', 0),
-                "lost_trades": analysis.get('lost', {}).get('total', 0)
-            }
-        except:
-            return {}
-    
-    def save_equity_curve(self, cerebro: bt.Cerebro, filepath: str):
-        """Save equity curve to CSV.
-        
-        Args:
-            cerebro: Cerebro instance after run
-            filepath: Path to save CSV
-        """
-        # This would require tracking portfolio value over time
-        # For now, placeholder
-        pass
+        analysis = analyzer.get_analysis()
+        return {
+            "total_trades": _get(analysis, 'total', 'total', default=0),
+            "won_trades": _get(analysis, 'won', 'total', default=0),
+            "lost_trades": _get(analysis, 'lost', 'total', default=0)
+        }
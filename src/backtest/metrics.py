@@ -2,17 +2,53 @@
 Performance metrics calculation.
 Computes CAGR, Sharpe, Sortino, Calmar, and excess returns.
 """
+import math
 import pandas as pd
 import numpy as np
-from typing import Dict, Any, Optional
+from functools import lru_cache
+from typing import Dict, Any, Optional, Union
 from datetime import datetime
+from ._metrics_kernels import (
+    max_drawdown_kernel,
+    pct_change_kernel,
+    sharpe_kernel,
+    sortino_kernel,
+)
+
+
+# Trading days per year used to annualize daily statistics
+TRADING_DAYS = 252
+_SQRT_TRADING_DAYS = math.sqrt(TRADING_DAYS)
+
+
+@lru_cache(maxsize=32)
+def _daily_rate(annual_rate: float) -> float:
+    """Convert an annual rate to the equivalent per-trading-day rate."""
+    return (1 + annual_rate) ** (1 / TRADING_DAYS) - 1
+
+
+def _as_float_array(
+    values: Union[pd.Series, np.ndarray],
+    dtype: str = 'float64'
+) -> np.ndarray:
+    """Return values as a contiguous float array without missing entries."""
+    array = np.ascontiguousarray(values, dtype=dtype)
+    return array[~np.isnan(array)]
 
 
 class MetricsCalculator:
     """Calculate performance metrics for backtests and benchmarks."""
     
-    def __init__(self):
+    def __init__(self, precision: str = 'float64'):
+        """Initialize the calculator.
+        
+        Args:
+            precision: Float dtype for the scale-invariant kernels (returns,
+                Sharpe, Sortino, drawdown); 'float32' halves the memory they
+                scan. Total return and CAGR always use float64.
+        """
         self.risk_free_rate = 0.02  # 2% annual risk-free rate
+        self.precision = precision
     
     def calculate_metrics(
         self,
@@ -31,17 +67,20 @@ class MetricsCalculator:
         if equity_curve.empty:
             return {}
         
-        # Calculate returns
-        returns = equity_curve['value'].pct_change().dropna()
+        # Calculate returns once on the raw values
+        returns = pct_change_kernel(_as_float_array(equity_curve['value'], self.precision))
+        returns = returns[~np.isnan(returns)]
         
-        # Calculate metrics
+        # Calculate metrics; Calmar reuses CAGR and drawdown
+        cagr = self.cagr(equity_curve)
+        max_dd = self.max_drawdown(equity_curve)
         metrics = {
             'tot_return': self.total_return(equity_curve),
-            'cagr': self.cagr(equity_curve),
-            'max_dd': self.max_drawdown(equity_curve),
+            'cagr': cagr,
+            'max_dd': max_dd,
             'sharpe': self.sharpe_ratio(returns),
             'sortino': self.sortino_ratio(returns),
-            'calmar': self.calmar_ratio(equity_curve)
+            'calmar': self._calmar_from_scalars(cagr, max_dd)
         }
         
         # Calculate excess return if benchmark provided
@@ -83,22 +122,36 @@ class MetricsCalculator:
         if equity_curve.empty or len(equity_curve) < 2:
             return 0.0
         
-        starting_value = equity_curve['value'].iloc[0]
-        ending_value = equity_curve['value'].iloc[-1]
-        
-        # Calculate years
-        if 'date' in equity_curve.columns:
-            start_date = pd.to_datetime(equity_curve['date'].iloc[0])
-            end_date = pd.to_datetime(equity_curve['date'].iloc[-1])
-            years = (end_date - start_date).days / 365.25
-        else:
-            years = len(equity_curve) / 252  # Assume 252 trading days per year
+        values = equity_curve['value']
+        return self._cagr_from_scalars(values.iloc[0], values.iloc[-1], self._years(equity_curve))
+    
+    @staticmethod
+    def _years(equity_curve: pd.DataFrame) -> float:
+        """Span of an equity curve in years.
         
+        Args:
+            equity_curve: DataFrame with portfolio values and optional dates
+            
+        Returns:
+            Calendar years between the first and last date, or the bar
+            count over TRADING_DAYS when the curve has no dates
+        """
+        if 'date' not in equity_curve.columns:
+            return len(equity_curve) / TRADING_DAYS
+        
+        # Only the two endpoints are parsed, and only if not already dates
+        dates = equity_curve['date'].iloc[[0, -1]]
+        if not pd.api.types.is_datetime64_any_dtype(dates):
+            dates = pd.to_datetime(dates)
+        return (dates.iloc[1] - dates.iloc[0]).days / 365.25
+    
+    @staticmethod
+    def _cagr_from_scalars(starting_value: float, ending_value: float, years: float) -> float:
+        """CAGR from the curve's endpoints and its span in years."""
         if years <= 0 or starting_value <= 0:
             return 0.0
         
-        cagr = (ending_value / starting_value) ** (1 / years) - 1
-        return cagr
+        return (ending_value / starting_value) ** (1 / years) - 1
     
     def max_drawdown(self, equity_curve: pd.DataFrame) -> float:
         """Calculate maximum drawdown.
@@ -112,78 +165,55 @@ class MetricsCalculator:
         if equity_curve.empty:
             return 0.0
         
-        values = equity_curve['value']
-        cummax = values.cummax()
-        drawdown = (values - cummax) / cummax
+        values = _as_float_array(equity_curve['value'], self.precision)
+        if len(values) == 0:
+            return 0.0
         
-        return drawdown.min()
+        return float(max_drawdown_kernel(values))
     
     def sharpe_ratio(
         self,
-        returns: pd.Series,
+        returns: Union[pd.Series, np.ndarray],
         risk_free_rate: Optional[float] = None
     ) -> float:
         """Calculate Sharpe ratio.
         
         Args:
-            returns: Series of periodic returns
+            returns: Series or array of periodic returns
             risk_free_rate: Annual risk-free rate (uses class default if None)
             
         Returns:
             Annualized Sharpe ratio
         """
-        if returns.empty or returns.std() == 0:
-            return 0.0
-        
         rf = risk_free_rate if risk_free_rate is not None else self.risk_free_rate
         
-        # Convert annual risk-free rate to daily
-        daily_rf = (1 + rf) ** (1/252) - 1
-        
-        # Calculate excess returns
-        excess_returns = returns - daily_rf
-        
-        # Annualize
-        sharpe = (excess_returns.mean() / excess_returns.std()) * np.sqrt(252)
-        
-        return sharpe
+        return float(
+            sharpe_kernel(
+                _as_float_array(returns, self.precision), _daily_rate(rf), _SQRT_TRADING_DAYS
+            )
+        )
     
     def sortino_ratio(
         self,
-        returns: pd.Series,
+        returns: Union[pd.Series, np.ndarray],
         risk_free_rate: Optional[float] = None
     ) -> float:
         """Calculate Sortino ratio (using downside deviation).
         
         Args:
-            returns: Series of periodic returns
+            returns: Series or array of periodic returns
             risk_free_rate: Annual risk-free rate
             
         Returns:
             Annualized Sortino ratio
         """
-        if returns.empty:
-            return 0.0
-        
         rf = risk_free_rate if risk_free_rate is not None else self.risk_free_rate
-        daily_rf = (1 + rf) ** (1/252) - 1
-        
-        # Calculate downside returns (only negative)
-        downside_returns = returns[returns < daily_rf]
-        
-        if len(downside_returns) == 0 or downside_returns.std() == 0:
-            return 0.0
         
-        # Calculate excess return
-        excess_return = returns.mean() - daily_rf
-        
-        # Downside deviation
-        downside_std = downside_returns.std()
-        
-        # Annualize
-        sortino = (excess_return / downside_std) * np.sqrt(252)
-        
-        return sortino
+        return float(
+            sortino_kernel(
+                _as_float_array(returns, self.precision), _daily_rate(rf), _SQRT_TRADING_DAYS
+            )
+        )
     
     def calmar_ratio(self, equity_curve: pd.DataFrame) -> float:
         """Calculate Calmar ratio (CAGR / Max Drawdown).
@@ -194,8 +224,12 @@ class MetricsCalculator:
         Returns:
             Calmar ratio
         """
-        cagr_val = self.cagr(equity_curve)
-        max_dd = abs(self.max_drawdown(equity_curve))
+        return self._calmar_from_scalars(self.cagr(equity_curve), self.max_drawdown(equity_curve))
+    
+    @staticmethod
+    def _calmar_from_scalars(cagr_val: float, max_dd: float) -> float:
+        """Calmar ratio from an already computed CAGR and max drawdown."""
+        max_dd = abs(max_dd)
         
         if max_dd == 0:
             return 0.0
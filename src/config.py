@@ -18,6 +18,9 @@ DEFAULT_SYMBOLS = [
     "NVDA", "META", "NFLX", "AMZN", "VOO", "AAPL", "BABA"
 ]
 
+# Maximum concurrent yfinance requests per download batch
+DOWNLOAD_MAX_WORKERS = 8
+
 # Benchmark symbols
 BENCHMARK_SYMBOLS = ["VOO", "SPY", "QQQ"]
 
@@ -0,0 +1,149 @@
+"""
+Fused indicator kernel for IndicatorCalculator.
+One forward pass over the close array computes every standard indicator
+column. It is only used when numba is installed; as plain Python the loop
+would be slower than the pandas path it replaces.
+"""
+from typing import Dict, Optional
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - optional dependency
+    njit = None
+
+# Rows of the kernel output, named like IndicatorCalculator.calculate_all's
+# columns
+FUSED_COLUMNS = (
+    'SMA_20', 'SMA_50', 'SMA_200', 'EMA_12', 'EMA_26', 'RSI',
+    'MACD', 'MACD_Signal', 'MACD_Histogram', 'BB_Upper', 'BB_Middle', 'BB_Lower',
+)
+
+
+def _indicators_loop(close: np.ndarray) -> np.ndarray:
+    """Compute the standard indicators in one pass.
+    
+    Matches the pandas definitions in IndicatorCalculator: SMAs and the
+    RSI gain/loss averages are simple rolling means, EMAs use adjust=False
+    seeded with the first close, and the Bollinger std has ddof=1.
+    
+    Args:
+        close: float64 close prices without NaNs
+    
+    Returns:
+        (len(FUSED_COLUMNS), len(close)) array, NaN where a window is
+        not yet full
+    """
+    n = close.shape[0]
+    out = np.full((12, n), np.nan)
+    if n == 0:
+        return out
+    
+    alpha_12 = 2.0 / 13.0
+    alpha_26 = 2.0 / 27.0
+    alpha_9 = 2.0 / 10.0
+    
+    sum_20 = 0.0
+    sum_50 = 0.0
+    sum_200 = 0.0
+    gain_sum = 0.0
+    loss_sum = 0.0
+    gains = np.zeros(n)
+    losses = np.zeros(n)
+    
+    ema_12 = close[0]
+    ema_26 = close[0]
+    signal = 0.0
+    
+    for i in range(n):
+        x = close[i]
+        
+        # Simple moving averages from running window sums
+        sum_20 += x
+        sum_50 += x
+        sum_200 += x
+        if i >= 20:
+            sum_20 -= close[i - 20]
+        if i >= 50:
+            sum_50 -= close[i - 50]
+        if i >= 200:
+            sum_200 -= close[i - 200]
+        if i >= 19:
+            mean_20 = sum_20 / 20.0
+            out[0, i] = mean_20
+            
+            # Bollinger bands: two-pass variance over the 20-bar window
+            sq = 0.0
+            for j in range(i - 19, i + 1):
+                d = close[j] - mean_20
+                sq += d * d
+            std = np.sqrt(sq / 19.0)
+            out[9, i] = mean_20 + 2.0 * std
+            out[10, i] = mean_20
+            out[11, i] = mean_20 - 2.0 * std
+        if i >= 49:
+            out[1, i] = sum_50 / 50.0
+        if i >= 199:
+            out[2, i] = sum_200 / 200.0
+        
+        # EMAs and MACD, seeded with the first close
+        if i > 0:
+            ema_12 += alpha_12 * (x - ema_12)
+            ema_26 += alpha_26 * (x - ema_26)
+        out[3, i] = ema_12
+        out[4, i] = ema_26
+        macd = ema_12 - ema_26
+        if i == 0:
+            signal = macd
+        else:
+            signal += alpha_9 * (macd - signal)
+        out[6, i] = macd
+        out[7, i] = signal
+        out[8, i] = macd - signal
+        
+        # RSI from 14-bar mean gain and loss; the first bar has no change
+        if i > 0:
+            delta = x - close[i - 1]
+            if delta > 0:
+                gains[i] = delta
+            elif delta < 0:
+                losses[i] = -delta
+        gain_sum += gains[i]
+        loss_sum += losses[i]
+        if i >= 14:
+            gain_sum -= gains[i - 14]
+            loss_sum -= losses[i - 14]
+        if i >= 13:
+            if loss_sum == 0.0:
+                out[5, i] = 100.0 if gain_sum > 0.0 else np.nan
+            else:
+                out[5, i] = 100.0 - 100.0 / (1.0 + gain_sum / loss_sum)
+    
+    return out
+
+
+if njit is not None:
+    _indicators_kernel = njit(cache=True)(_indicators_loop)
+else:
+    _indicators_kernel = None
+
+
+def fused_indicator_columns(close: np.ndarray) -> Optional[Dict[str, np.ndarray]]:
+    """Run the fused kernel when it can stand in for the pandas path.
+    
+    Args:
+        close: Close prices
+    
+    Returns:
+        Mapping of column name to values, or None when numba is not
+        installed or the series has gaps (pandas' NaN handling applies)
+    """
+    if _indicators_kernel is None:
+        return None
+    
+    close = np.ascontiguousarray(close, dtype=np.float64)
+    if np.isnan(close).any():
+        return None
+    
+    return dict(zip(FUSED_COLUMNS, _indicators_kernel(close)))
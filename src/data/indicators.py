@@ -6,7 +6,28 @@ import pandas as pd
 import numpy as np
 from typing import Optional, Dict, List
 from datetime import datetime
-from src.db import get_db
+from src.db import Database, get_db
+from ._indicator_kernels import fused_indicator_columns
+
+
+# Calculated indicator columns, in technical_indicators column order
+_INDICATOR_COLUMNS = (
+    'SMA_20', 'SMA_50', 'SMA_200', 'EMA_12', 'EMA_26', 'RSI',
+    'MACD', 'MACD_Signal', 'MACD_Histogram', 'BB_Upper', 'BB_Middle', 'BB_Lower',
+)
+
+
+# calculate_all indicator names the fused kernel covers, and their columns
+_FUSED_INDICATOR_COLUMNS = {
+    'sma_20': ('SMA_20',),
+    'sma_50': ('SMA_50',),
+    'sma_200': ('SMA_200',),
+    'ema_12': ('EMA_12',),
+    'ema_26': ('EMA_26',),
+    'rsi': ('RSI',),
+    'macd': ('MACD', 'MACD_Signal', 'MACD_Histogram'),
+    'bbands': ('BB_Middle', 'BB_Upper', 'BB_Lower'),
+}
 
 
 class IndicatorCalculator:
@@ -132,6 +153,20 @@ class IndicatorCalculator:
         if indicators is None:
             indicators = ['sma_20', 'sma_50', 'rsi', 'macd', 'bbands']
         
+        # With numba installed, one fused pass over the close prices yields
+        # every standard column; anything it does not cover uses pandas
+        fused = fused_indicator_columns(data['close'].to_numpy())
+        if fused is not None:
+            remaining = []
+            for indicator in indicators:
+                columns = _FUSED_INDICATOR_COLUMNS.get(indicator, ())
+                if columns:
+                    for column in columns:
+                        result[column] = fused[column]
+                else:
+                    remaining.append(indicator)
+            indicators = remaining
+        
         for indicator in indicators:
             if indicator.startswith('sma_'):
                 period = int(indicator.split('_')[1])
@@ -162,8 +197,14 @@ class IndicatorCalculator:
 class IndicatorStorage:
     """Store and retrieve technical indicators from database."""
     
-    def __init__(self):
-        self.db = get_db()
+    def __init__(self, db: Optional[Database] = None):
+        """Initialize the storage.
+        
+        Args:
+            db: Database to store indicators in. Defaults to the shared
+                instance from get_db().
+        """
+        self.db = db or get_db()
     
     def save_indicators(self, symbol: str, data: pd.DataFrame, interval: str = "1d"):
         """Calculate and save indicators to database.
@@ -179,9 +220,6 @@ class IndicatorStorage:
             indicators=['sma_20', 'sma_50', 'sma_200', 'ema_12', 'ema_26', 'rsi', 'macd', 'bbands']
         )
         
-        # Prepare data for insertion
-        conn = self.db.connect()
-        cursor = conn.cursor()
         calculated_at = datetime.now().isoformat()
         
         # Use INSERT OR REPLACE for upsert behavior
@@ -192,33 +230,23 @@ class IndicatorStorage:
             VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
         """
         
-        rows_inserted = 0
-        for _, row in df_with_ind.iterrows():
-            # Convert date to string if it's datetime
-            date_str = row['date'].strftime('%Y-%m-%d') if isinstance(row['date'], pd.Timestamp) else str(row['date'])
-            
-            cursor.execute(query, (
-                symbol,
-                date_str,
-                interval,
-                float(row['SMA_20']) if pd.notna(row['SMA_20']) else None,
-                float(row['SMA_50']) if pd.notna(row['SMA_50']) else None,
-                float(row['SMA_200']) if pd.notna(row['SMA_200']) else None,
-                float(row['EMA_12']) if pd.notna(row['EMA_12']) else None,
-                float(row['EMA_26']) if pd.notna(row['EMA_26']) else None,
-                float(row['RSI']) if pd.notna(row['RSI']) else None,
-                float(row['MACD']) if pd.notna(row['MACD']) else None,
-                float(row['MACD_Signal']) if pd.notna(row['MACD_Signal']) else None,
-                float(row['MACD_Histogram']) if pd.notna(row['MACD_Histogram']) else None,
-                float(row['BB_Upper']) if pd.notna(row['BB_Upper']) else None,
-                float(row['BB_Middle']) if pd.notna(row['BB_Middle']) else None,
-                float(row['BB_Lower']) if pd.notna(row['BB_Lower']) else None,
-                calculated_at
-            ))
-            rows_inserted += 1
-        
-        conn.commit()
-        return rows_inserted
+        # Build every row's parameters column-wise instead of per row
+        dates = df_with_ind['date']
+        if pd.api.types.is_datetime64_any_dtype(dates):
+            dates = dates.dt.strftime('%Y-%m-%d')
+        
+        values = df_with_ind[list(_INDICATOR_COLUMNS)].to_numpy(dtype='float64', na_value=np.nan)
+        params = values.astype(object)
+        params[np.isnan(values)] = None
+        
+        rows = [
+            (symbol, date_str, interval, *row, calculated_at)
+            for date_str, row in zip(dates.astype(str).tolist(), params.tolist())
+        ]
+        
+        # One prepared statement and one commit for the whole frame
+        self.db.executemany(query, rows)
+        return len(rows)
     
     def get_indicators(
         self,
@@ -262,7 +290,7 @@ class IndicatorStorage:
         df = pd.DataFrame(rows)
         
         if not df.empty:
-            df['date'] = pd.to_datetime(df['date'])
+            df['date'] = pd.to_datetime(df['date'], format='ISO8601')
         
         return df
     
@@ -312,10 +340,68 @@ class IndicatorStorage:
         df = pd.DataFrame(rows)
         
         if not df.empty:
-            df['date'] = pd.to_datetime(df['date'])
+            df['date'] = pd.to_datetime(df['date'], format='ISO8601')
         
         return df
     
+    def get_indicators_with_ohlcv_bulk(
+        self,
+        symbols: List[str],
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        interval: str = "1d"
+    ) -> Dict[str, pd.DataFrame]:
+        """Retrieve joined OHLCV and indicator data for several symbols at once.
+        
+        Issues a single query for the whole list instead of one per symbol.
+        
+        Args:
+            symbols: Stock ticker symbols
+            start: Optional start date filter
+            end: Optional end date filter
+            interval: Data interval
+            
+        Returns:
+            Mapping of symbol to a DataFrame with the columns of
+            get_indicators_with_ohlcv, indexed by ascending datetime date;
+            symbols without data are omitted
+        """
+        if not symbols:
+            return {}
+        
+        placeholders = ", ".join("?" * len(symbols))
+        query = f"""
+            SELECT 
+                e.symbol, e.date, e.interval,
+                e.open, e.high, e.low, e.close, e.volume,
+                i.sma_20, i.sma_50, i.sma_200, i.ema_12, i.ema_26, i.rsi_14,
+                i.macd, i.macd_signal, i.macd_histogram,
+                i.bb_upper, i.bb_middle, i.bb_lower
+            FROM equities_ohlcv e
+            LEFT JOIN technical_indicators i 
+                ON e.symbol = i.symbol AND e.date = i.date AND e.interval = i.interval
+            WHERE e.symbol IN ({placeholders}) AND e.interval = ?
+        """
+        params = [*symbols, interval]
+        
+        if start:
+            query += " AND e.date >= ?"
+            params.append(start)
+        
+        if end:
+            query += " AND e.date <= ?"
+            params.append(end)
+        
+        query += " ORDER BY e.symbol, e.date"
+        
+        df = self.db.read_frame(query, tuple(params), parse_dates={"date": {"format": "ISO8601"}})
+        
+        # Rows are already date-ordered per symbol, so the index is sorted
+        return {
+            symbol: group.set_index("date")
+            for symbol, group in df.groupby("symbol", sort=False)
+        }
+    
     def has_indicators(self, symbol: str, interval: str = "1d") -> bool:
         """Check if indicators exist for a symbol.
         
@@ -37,6 +37,19 @@ class OptionsDataManager:
         "source",
         "asof",
     )
+
+    # Compact dtypes for chain previews; volume/open_interest use the
+    # nullable integer type because SQLite rows may carry NULLs.
+    CHAIN_DTYPES: Dict[str, str] = {
+        "strike": "float32",
+        "bid": "float32",
+        "ask": "float32",
+        "last": "float32",
+        "mid": "float32",
+        "volume": "Int32",
+        "open_interest": "Int32",
+        "right": "category",
+    }
     
     def __init__(self):
         self.db = get_db()
@@ -317,9 +330,6 @@ class OptionsDataManager:
 
         df = self._finalize_for_insert(df)
 
-        conn = self.db.connect()
-        cursor = conn.cursor()
-
         placeholders = ", ".join(["?"] * len(self.DB_COLUMNS))
         columns_sql = ", ".join(self.DB_COLUMNS)
         query = f"""
@@ -328,8 +338,7 @@ class OptionsDataManager:
         """
 
         records = [tuple(row) for row in df.itertuples(index=False, name=None)]
-        cursor.executemany(query, records)
-        conn.commit()
+        self.db.executemany(query, records)
         return len(records)
     
     def get_option_chain(
@@ -368,7 +377,12 @@ class OptionsDataManager:
         query += " ORDER BY expiration, strike"
         
         rows = self.db.fetchall(query, tuple(params))
-        return pd.DataFrame(rows)
+        df = pd.DataFrame(rows)
+        if df.empty:
+            return df
+
+        dtypes = {col: dtype for col, dtype in self.CHAIN_DTYPES.items() if col in df.columns}
+        return df.astype(dtypes)
 
     def get_available_symbols(self) -> List[str]:
         """Return distinct symbols with cached option data."""
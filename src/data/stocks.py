@@ -4,16 +4,43 @@ Downloads and caches OHLCV data to SQLite.
 """
 import yfinance as yf
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import List, Optional
-from src.db import get_db
+from itertools import islice
+from typing import Dict, List, Optional, Tuple
+import threading
+import time
+from src.db import Database, get_db
+from src import config
+
+# Rows per executemany call when bulk-inserting OHLCV data
+_INSERT_BATCH_SIZE = 10_000
+
+# How long a downloaded (symbol, start, end, interval) response stays fresh,
+# aligned with how often bars of that interval can change.
+_DOWNLOAD_TTL_SECONDS = {
+    "1d": 24 * 60 * 60,
+    "1h": 60 * 60,
+    "15m": 15 * 60,
+    "5m": 5 * 60,
+}
+_DEFAULT_DOWNLOAD_TTL = 5 * 60
+
+_download_cache: Dict[Tuple[str, str, str, str], Tuple[float, pd.DataFrame]] = {}
+_download_cache_lock = threading.Lock()
 
 
 class StockDataManager:
     """Manager for downloading and caching stock OHLCV data."""
     
-    def __init__(self):
-        self.db = get_db()
+    def __init__(self, db: Optional[Database] = None):
+        """Initialize the manager.
+        
+        Args:
+            db: Database to cache prices in. Defaults to the shared
+                instance from get_db().
+        """
+        self.db = db or get_db()
     
     def download_stocks(
         self,
@@ -39,80 +66,130 @@ class StockDataManager:
             "total_rows": 0
         }
         
-        for symbol in symbols:
-            try:
-                # Download data from yfinance
-                ticker = yf.Ticker(symbol)
-                df = ticker.history(start=start, end=end, interval=interval)
-                
-                if df.empty:
-                    results["failed"].append({
+        # Network fetches are I/O bound, so overlap them across a thread pool.
+        # Database writes stay on this thread since the connection is shared.
+        max_workers = max(1, min(config.DOWNLOAD_MAX_WORKERS, len(symbols)))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(self._download_one, symbol, start, end, interval)
+                for symbol in symbols
+            ]
+            
+            # Persist in input order while later symbols are still downloading
+            for symbol, future in zip(symbols, futures):
+                try:
+                    df = future.result()
+                    
+                    if df.empty:
+                        results["failed"].append({
+                            "symbol": symbol,
+                            "error": "No data returned"
+                        })
+                        continue
+                    
+                    # Prepare data for insertion
+                    df.reset_index(inplace=True)
+                    df['symbol'] = symbol
+                    df['interval'] = interval
+                    df['source'] = 'yfinance'
+                    df['asof'] = datetime.now().isoformat()
+                    
+                    # Rename columns to match schema
+                    df.rename(columns={
+                        'Date': 'date',
+                        'Open': 'open',
+                        'High': 'high',
+                        'Low': 'low',
+                        'Close': 'close',
+                        'Volume': 'volume'
+                    }, inplace=True)
+                    
+                    # Convert date to string
+                    df['date'] = df['date'].dt.strftime('%Y-%m-%d')
+                    
+                    # Add adj_close if not present (use close)
+                    if 'adj_close' not in df.columns:
+                        df['adj_close'] = df['close']
+                    
+                    # Select only needed columns
+                    columns = [
+                        'symbol', 'date', 'interval', 'open', 'high', 
+                        'low', 'close', 'adj_close', 'volume', 'source', 'asof'
+                    ]
+                    df = df[columns]
+                    
+                    # Insert into database (replace on conflict)
+                    inserted = self._insert_equity_data(df)
+                    
+                    # Calculate and store indicators
+                    try:
+                        from .indicators import IndicatorStorage
+                        indicator_storage = IndicatorStorage(self.db)
+                        
+                        # Re-fetch data with proper format for indicator calculation
+                        df_for_indicators = self.get_cached_data(symbol, interval=interval)
+                        if not df_for_indicators.empty:
+                            indicators_inserted = indicator_storage.save_indicators(symbol, df_for_indicators, interval)
+                    except Exception as ind_error:
+                        # Don't fail the whole download if indicators fail
+                        print(f"Warning: Failed to calculate indicators for {symbol}: {ind_error}")
+                    
+                    results["success"].append({
                         "symbol": symbol,
-                        "error": "No data returned"
+                        "rows": inserted
                     })
-                    continue
-                
-                # Prepare data for insertion
-                df.reset_index(inplace=True)
-                df['symbol'] = symbol
-                df['interval'] = interval
-                df['source'] = 'yfinance'
-                df['asof'] = datetime.now().isoformat()
-                
-                # Rename columns to match schema
-                df.rename(columns={
-                    'Date': 'date',
-                    'Open': 'open',
-                    'High': 'high',
-                    'Low': 'low',
-                    'Close': 'close',
-                    'Volume': 'volume'
-                }, inplace=True)
-                
-                # Convert date to string
-                df['date'] = df['date'].dt.strftime('%Y-%m-%d')
-                
-                # Add adj_close if not present (use close)
-                if 'adj_close' not in df.columns:
-                    df['adj_close'] = df['close']
-                
-                # Select only needed columns
-                columns = [
-                    'symbol', 'date', 'interval', 'open', 'high', 
-                    'low', 'close', 'adj_close', 'volume', 'source', 'asof'
-                ]
-                df = df[columns]
-                
-                # Insert into database (replace on conflict)
-                inserted = self._insert_equity_data(df)
-                
-                # Calculate and store indicators
-                try:
-                    from .indicators import IndicatorStorage
-                    indicator_storage = IndicatorStorage()
+                    results["total_rows"] += inserted
                     
-                    # Re-fetch data with proper format for indicator calculation
-                    df_for_indicators = self.get_cached_data(symbol, interval=interval)
-                    if not df_for_indicators.empty:
-                        indicators_inserted = indicator_storage.save_indicators(symbol, df_for_indicators, interval)
-                except Exception as ind_error:
-                    # Don't fail the whole download if indicators fail
-                    print(f"Warning: Failed to calculate indicators for {symbol}: {ind_error}")
-                
-                results["success"].append({
-                    "symbol": symbol,
-                    "rows": inserted
-                })
-                results["total_rows"] += inserted
-                
-            except Exception as e:
-                results["failed"].append({
-                    "symbol": symbol,
-                    "error": str(e)
-                })
+                except Exception as e:
+                    results["failed"].append({
+                        "symbol": symbol,
+                        "error": str(e)
+                    })
         
         return results
     
+    def _download_one(
+        self,
+        symbol: str,
+        start: str,
+        end: str,
+        interval: str = "1d"
+    ) -> pd.DataFrame:
+        """Fetch raw price history for one symbol from yfinance.
+        
+        Args:
+            symbol: Stock ticker symbol
+            start: Start date (YYYY-MM-DD)
+            end: End date (YYYY-MM-DD)
+            interval: Data interval
+            
+        Returns:
+            DataFrame as returned by yfinance (may be empty)
+        """
+        key = (symbol, start, end, interval)
+        ttl = _DOWNLOAD_TTL_SECONDS.get(interval, _DEFAULT_DOWNLOAD_TTL)
+        now = time.monotonic()
+
+        with _download_cache_lock:
+            cached = _download_cache.get(key)
+        if cached is not None and now - cached[0] < ttl:
+            # Callers mutate the frame in place, so hand out a copy
+            return cached[1].copy()
+
+        ticker = yf.Ticker(symbol)
+        df = ticker.history(start=start, end=end, interval=interval)
+
+        if not df.empty:
+            with _download_cache_lock:
+                # Drop stale responses so the cache does not grow unbounded
+                for stale_key in [
+                    k for k, (fetched_at, _) in _download_cache.items()
+                    if now - fetched_at >= _DOWNLOAD_TTL_SECONDS.get(k[3], _DEFAULT_DOWNLOAD_TTL)
+                ]:
+                    del _download_cache[stale_key]
+                _download_cache[key] = (now, df.copy())
+        return df
+    
     def _insert_equity_data(self, df: pd.DataFrame) -> int:
         """Insert equity data into database.
         
@@ -122,35 +199,30 @@ class StockDataManager:
         Returns:
             Number of rows inserted
         """
-        conn = self.db.connect()
-        
         # Use INSERT OR REPLACE for upsert behavior
         query = """
             INSERT OR REPLACE INTO equities_ohlcv 
             (symbol, date, interval, open, high, low, close, adj_close, volume, source, asof)
             VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
         """
+        columns = [
+            'symbol', 'date', 'interval', 'open', 'high',
+            'low', 'close', 'adj_close', 'volume', 'source', 'asof'
+        ]
         
-        cursor = conn.cursor()
+        # Stream column-ordered tuples in fixed-size batches; everything is
+        # committed once at the end so SQLite reuses one prepared statement.
+        rows = df[columns].itertuples(index=False, name=None)
         rows_inserted = 0
         
-        for _, row in df.iterrows():
-            cursor.execute(query, (
-                row['symbol'],
-                row['date'],
-                row['interval'],
-                row['open'],
-                row['high'],
-                row['low'],
-                row['close'],
-                row['adj_close'],
-                row['volume'],
-                row['source'],
-                row['asof']
-            ))
-            rows_inserted += 1
+        with self.db.transaction() as cursor:
+            while True:
+                batch = list(islice(rows, _INSERT_BATCH_SIZE))
+                if not batch:
+                    break
+                cursor.executemany(query, batch)
+                rows_inserted += len(batch)
         
-        conn.commit()
         return rows_inserted
     
     def get_cached_data(
@@ -192,7 +264,7 @@ class StockDataManager:
         df = pd.DataFrame(rows)
         
         if not df.empty:
-            df['date'] = pd.to_datetime(df['date'])
+            df['date'] = pd.to_datetime(df['date'], format='ISO8601')
         
         return df
     
@@ -259,23 +331,19 @@ class StockDataManager:
         df = pd.DataFrame(rows)
 
         if not df.empty:
-            df['date'] = pd.to_datetime(df['date'])
+            df['date'] = pd.to_datetime(df['date'], format='ISO8601')
 
         return df
 
     def delete_symbol(self, symbol: str) -> dict:
         """Delete all cached data and indicators for a symbol."""
 
-        conn = self.db.connect()
-        cursor = conn.cursor()
-
-        cursor.execute("DELETE FROM equities_ohlcv WHERE symbol = ?", (symbol,))
-        equity_rows = cursor.rowcount or 0
+        with self.db.transaction() as cursor:
+            cursor.execute("DELETE FROM equities_ohlcv WHERE symbol = ?", (symbol,))
+            equity_rows = cursor.rowcount or 0
 
-        cursor.execute("DELETE FROM technical_indicators WHERE symbol = ?", (symbol,))
-        indicator_rows = cursor.rowcount or 0
-
-        conn.commit()
+            cursor.execute("DELETE FROM technical_indicators WHERE symbol = ?", (symbol,))
+            indicator_rows = cursor.rowcount or 0
 
         return {
             "equity_rows": equity_rows,
@@ -285,16 +353,12 @@ class StockDataManager:
     def delete_all(self) -> dict:
         """Purge all equity data and related indicators."""
 
-        conn = self.db.connect()
-        cursor = conn.cursor()
-
-        cursor.execute("DELETE FROM equities_ohlcv")
-        equity_rows = cursor.rowcount or 0
-
-        cursor.execute("DELETE FROM technical_indicators")
-        indicator_rows = cursor.rowcount or 0
+        with self.db.transaction() as cursor:
+            cursor.execute("DELETE FROM equities_ohlcv")
+            equity_rows = cursor.rowcount or 0
 
-        conn.commit()
+            cursor.execute("DELETE FROM technical_indicators")
+            indicator_rows = cursor.rowcount or 0
 
         return {
             "equity_rows": equity_rows,
@@ -4,14 +4,37 @@ Creates and manages all SQLite tables.
 """
 import json
 import sqlite3
+import threading
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Any, Dict, Iterator, Optional, Tuple
 
 from src import config
 from src.models import Strategy as StrategyModel
 from src.strategy import StrategyCompiler
 
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Connection-level settings applied once when the shared connection opens.
+# WAL lets readers proceed while a writer commits; NORMAL sync is safe under WAL.
+# busy_timeout makes a reader wait for a concurrent status update instead of
+# failing with SQLITE_BUSY; cache_size is in KiB when negative (64 MiB).
+_CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA busy_timeout=5000",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA mmap_size=268435456",
+)
+
+# Size of sqlite3's per-connection prepared-statement cache (default 128).
+# The app issues a fixed set of parameterized statements, so keeping them
+# all prepared avoids re-parsing the same SQL on every page render.
+_CACHED_STATEMENTS = 256
+
 
 class Database:
     """SQLite database manager for Me Trade."""
@@ -25,12 +48,24 @@ class Database:
         self.db_path = db_path or config.DB_PATH
         Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
         self.conn = None
+        # The connection is shared with background backtest threads; the
+        # lock keeps one thread's statements out of another's transaction
+        self._lock = threading.RLock()
     
     def connect(self) -> sqlite3.Connection:
-        """Establish database connection with WAL mode."""
+        """Establish database connection with WAL mode and tuned PRAGMAs.
+        
+        The connection is opened once and reused for the lifetime of this
+        instance, so the PRAGMAs are only paid on first use.
+        """
         if self.conn is None:
-            self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
-            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn = sqlite3.connect(
+                self.db_path,
+                check_same_thread=False,
+                cached_statements=_CACHED_STATEMENTS,
+            )
+            for pragma in _CONNECTION_PRAGMAS:
+                self.conn.execute(pragma)
             self.conn.row_factory = sqlite3.Row
         return self.conn
     
@@ -67,6 +102,11 @@ class Database:
             CREATE INDEX IF NOT EXISTS idx_equities_symbol_date 
             ON equities_ohlcv(symbol, date)
         """)
+
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_equities_symbol_interval_date
+            ON equities_ohlcv(symbol, interval, date)
+        """)
         
         # Options chain table
         cursor.execute("""
@@ -193,6 +233,11 @@ class Database:
         for column in ["human_readable", "json_definition", "backtrader_code"]:
             if column not in existing_strategy_columns:
                 cursor.execute(f"ALTER TABLE strategies ADD COLUMN {column} TEXT")
+
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_strategies_created_at
+            ON strategies(created_at DESC)
+        """)
         
         # Generated code table
         cursor.execute("""
@@ -205,6 +250,11 @@ class Database:
                 FOREIGN KEY(strategy_id) REFERENCES strategies(id)
             )
         """)
+
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_codes_strategy_id
+            ON codes(strategy_id, created_at)
+        """)
         
         # Backtests table
         cursor.execute("""
@@ -224,6 +274,11 @@ class Database:
                 FOREIGN KEY(code_id) REFERENCES codes(id)
             )
         """)
+
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_backtests_created_at
+            ON backtests(created_at DESC)
+        """)
         
         # Metrics table
         cursor.execute("""
@@ -273,9 +328,43 @@ class Database:
             )
         """)
 
+        # The primary key already serves bt_id lookups ordered by timestamp,
+        # so the old single-column index only cost extra writes
+        cursor.execute("DROP INDEX IF EXISTS idx_equity_curves_bt_id")
+
+        # Lets the top gain/loss session queries walk the index in return
+        # order instead of sorting the whole curve
         cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_equity_curves_bt_id
-            ON equity_curves(bt_id)
+            CREATE INDEX IF NOT EXISTS idx_equity_curves_bt_return
+            ON equity_curves(bt_id, COALESCE(return_pct, 0))
+        """)
+
+        # Executed trades, one row per fill, in the order they were logged
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS trades (
+                bt_id TEXT NOT NULL,
+                seq INTEGER NOT NULL,
+                timestamp TEXT,
+                symbol TEXT,
+                action TEXT,
+                size REAL,
+                price REAL,
+                value REAL,
+                commission REAL,
+                pnl REAL,
+                pnl_pct REAL,
+                alloc_pct REAL,
+                portfolio_value REAL,
+                holding_period INTEGER,
+                reason TEXT,
+                PRIMARY KEY (bt_id, seq),
+                FOREIGN KEY(bt_id) REFERENCES backtests(id)
+            )
+        """)
+
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_trades_bt_timestamp
+            ON trades(bt_id, timestamp)
         """)
         
         conn.commit()
@@ -292,12 +381,57 @@ class Database:
         Returns:
             Cursor with results
         """
-        conn = self.connect()
-        cursor = conn.cursor()
-        cursor.execute(query, params)
-        conn.commit()
+        with self._lock:
+            conn = self.connect()
+            cursor = conn.cursor()
+            cursor.execute(query, params)
+            conn.commit()
+        return cursor
+    
+    def executemany(self, query: str, rows) -> sqlite3.Cursor:
+        """Execute a statement once per parameter row with a single commit.
+        
+        Args:
+            query: SQL statement to execute
+            rows: Iterable of parameter tuples
+            
+        Returns:
+            Cursor used for the statement
+        """
+        with self._lock:
+            conn = self.connect()
+            cursor = conn.cursor()
+            cursor.executemany(query, rows)
+            conn.commit()
         return cursor
     
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Cursor]:
+        """Run several statements inside one explicit transaction.
+        
+        The write lock is taken up front with BEGIN IMMEDIATE, and the
+        statements share a single commit. Any exception rolls back.
+        
+        Yields:
+            Cursor to execute statements on
+        """
+        with self._lock:
+            conn = self.connect()
+            if conn.in_transaction:
+                # Flush implicit work so it is not swept into this transaction
+                conn.commit()
+            cursor = conn.cursor()
+            cursor.execute("BEGIN IMMEDIATE")
+            try:
+                yield cursor
+            except Exception:
+                conn.rollback()
+                raise
+            else:
+                conn.commit()
+            finally:
+                cursor.close()
+    
     def fetchall(self, query: str, params: tuple = ()) -> list:
         """Execute query and fetch all results.
         
@@ -308,8 +442,11 @@ class Database:
         Returns:
             List of row dictionaries
         """
-        cursor = self.execute(query, params)
-        rows = cursor.fetchall()
+        # Held through the fetch so rows are read before another thread
+        # reuses the shared connection
+        with self._lock:
+            cursor = self.execute(query, params)
+            rows = cursor.fetchall()
         return [dict(row) for row in rows]
     
     def fetchone(self, query: str, params: tuple = ()) -> Optional[dict]:
@@ -322,10 +459,58 @@ class Database:
         Returns:
             Row dictionary or None
         """
-        cursor = self.execute(query, params)
-        row = cursor.fetchone()
+        with self._lock:
+            cursor = self.execute(query, params)
+            row = cursor.fetchone()
         return dict(row) if row else None
 
+    def read_frame(self, query: str, params: tuple = (), **kwargs) -> "pd.DataFrame":
+        """Execute a query straight into a DataFrame.
+        
+        Args:
+            query: SQL query to execute
+            params: Query parameters
+            **kwargs: Extra arguments for pandas.read_sql_query
+            
+        Returns:
+            DataFrame built column-wise from the result set
+        """
+        # Imported here so pages that never build frames skip loading pandas
+        import pandas as pd
+
+        with self._lock:
+            return pd.read_sql_query(query, self.connect(), params=params, **kwargs)
+    
+    def fetch_many(self, queries: Dict[str, Tuple[str, tuple, bool]]) -> Dict[str, Any]:
+        """Run several read queries in one round trip and one read snapshot.
+        
+        Args:
+            queries: Mapping of result name to (query, params, single_row)
+            
+        Returns:
+            Mapping of result name to a row dictionary (or None) when
+            single_row is set, otherwise to a list of row dictionaries
+        """
+        results: Dict[str, Any] = {}
+        with self._lock:
+            conn = self.connect()
+            if conn.in_transaction:
+                conn.commit()
+            cursor = conn.cursor()
+            cursor.execute("BEGIN DEFERRED")
+            try:
+                for name, (query, params, single_row) in queries.items():
+                    cursor.execute(query, params)
+                    if single_row:
+                        row = cursor.fetchone()
+                        results[name] = dict(row) if row else None
+                    else:
+                        results[name] = [dict(row) for row in cursor.fetchall()]
+            finally:
+                conn.commit()
+                cursor.close()
+        return results
+
     def _seed_default_strategies(self, conn: sqlite3.Connection):
         """Populate database with built-in strategy templates."""
         defaults = [
@@ -0,0 +1,47 @@
+"""
+Fast JSON helpers.
+Uses orjson when it is installed and falls back to the standard library.
+"""
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """Deserialize a JSON document.
+    
+    Args:
+        data: JSON text as str or bytes
+        
+    Returns:
+        Decoded Python object
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any, indent: bool = False) -> str:
+    """Serialize an object to JSON text.
+    
+    Args:
+        obj: Object to serialize
+        indent: Pretty-print with two-space indentation
+        
+    Returns:
+        JSON string
+    """
+    if orjson is not None:
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(obj, option=option).decode()
+        except TypeError:
+            # Types orjson rejects (e.g. oversized ints) go through json below
+            pass
+    return json.dumps(obj, indent=2 if indent else None)
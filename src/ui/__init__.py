@@ -1,9 +1,33 @@
 """UI helpers."""
 from .i18n import t, use_language_selector, get_language, set_language
+from .cache import (
+    active_llm_config,
+    available_symbols,
+    clear_backtest_caches,
+    clear_llm_config_caches,
+    clear_strategy_caches,
+    list_llm_configs,
+    list_strategies,
+    load_backtest_bundle,
+    load_strategy_bundle,
+    recent_backtests,
+)
+from .symbols import parse_symbols
 
 __all__ = [
     "t",
     "use_language_selector",
     "get_language",
     "set_language",
+    "available_symbols",
+    "list_strategies",
+    "load_strategy_bundle",
+    "recent_backtests",
+    "load_backtest_bundle",
+    "clear_backtest_caches",
+    "clear_strategy_caches",
+    "active_llm_config",
+    "list_llm_configs",
+    "clear_llm_config_caches",
+    "parse_symbols",
 ]
@@ -0,0 +1,153 @@
+"""Cached data lookups shared across pages.
+
+Streamlit reruns a page on every widget interaction, so read-mostly
+queries are memoized here. Pages that write the underlying data call
+the matching ``.clear()`` afterwards.
+"""
+from typing import Any, Dict, FrozenSet, List, Optional
+
+import streamlit as st
+
+from src.db import get_db
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def available_symbols() -> FrozenSet[str]:
+    """Symbols with cached stock data.
+    
+    Returns:
+        Frozen set of symbol strings, for O(1) membership tests
+    """
+    # Imported here so pages that only need the DB lookups skip yfinance
+    from src.data import StockDataManager
+
+    return frozenset(StockDataManager().get_available_symbols())
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def list_strategies() -> List[Dict[str, Any]]:
+    """Saved strategies, newest first.
+    
+    Returns:
+        List of dicts with ``id`` and ``name``
+    """
+    return get_db().fetchall("SELECT id, name FROM strategies ORDER BY created_at DESC")
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def load_strategy_bundle(strategy_id: str) -> Optional[Dict[str, Any]]:
+    """Strategy JSON together with its most recent generated code.
+    
+    Args:
+        strategy_id: Strategy identifier
+        
+    Returns:
+        Dict with ``json``, ``code_id`` and ``code`` (the code fields are
+        None when no code exists), or None if the strategy does not exist
+    """
+    return get_db().fetchone(
+        """SELECT s.json, c.id AS code_id, c.code
+           FROM strategies s
+           LEFT JOIN codes c ON c.strategy_id = s.id
+           WHERE s.id = ?
+           ORDER BY c.created_at DESC
+           LIMIT 1""",
+        (strategy_id,),
+    )
+
+
+@st.cache_data(ttl=15, show_spinner=False)
+def recent_backtests(limit: int = 10) -> List[Dict[str, Any]]:
+    """Latest backtests with their strategy name and total return.
+    
+    Args:
+        limit: Maximum number of rows to return
+        
+    Returns:
+        List of dicts with ``id``, ``name``, ``status``, ``created_at``
+        and ``tot_return``
+    """
+    return get_db().fetchall(
+        """SELECT b.id, s.name, b.status, b.created_at, m.tot_return
+           FROM backtests b
+           JOIN strategies s ON b.strategy_id = s.id
+           LEFT JOIN metrics_run m ON b.id = m.bt_id
+           ORDER BY b.created_at DESC
+           LIMIT ?""",
+        (limit,),
+    )
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def load_backtest_bundle(bt_id: str) -> Dict[str, Any]:
+    """Backtest row and metrics fetched in one round trip.
+    
+    Args:
+        bt_id: Backtest identifier
+        
+    Returns:
+        Dict with ``backtest`` (row joined with strategy name and JSON) and
+        ``metrics`` (row or None)
+    """
+    return get_db().fetch_many(
+        {
+            "backtest": (
+                """SELECT b.*, s.name as strategy_name, s.json as strategy_json
+                   FROM backtests b
+                   JOIN strategies s ON b.strategy_id = s.id
+                   WHERE b.id = ?""",
+                (bt_id,),
+                True,
+            ),
+            "metrics": (
+                "SELECT * FROM metrics_run WHERE bt_id = ?",
+                (bt_id,),
+                True,
+            ),
+        }
+    )
+
+
+# Display form of an API key (first 8 and last 4 characters), computed in
+# SQL so it is built once per cache fill rather than on every render
+_MASKED_KEY_SQL = "substr(api_key, 1, 8) || '...' || substr(api_key, -4) AS masked_key"
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def list_llm_configs() -> List[Dict[str, Any]]:
+    """All saved LLM configurations, newest first.
+    
+    Each row carries an extra ``masked_key`` field for display.
+    """
+    return get_db().fetchall(
+        f"SELECT *, {_MASKED_KEY_SQL} FROM llm_configs ORDER BY created_at DESC"
+    )
+
+
+def active_llm_config() -> Optional[Dict[str, Any]]:
+    """The active LLM configuration row, or None if none is active.
+    
+    Picked out of the cached list_llm_configs result rather than queried
+    separately.
+    """
+    return next((c for c in list_llm_configs() if c["is_active"]), None)
+
+
+def clear_strategy_caches() -> None:
+    """Drop cached strategy lookups after a strategy is written."""
+    list_strategies.clear()
+    load_strategy_bundle.clear()
+
+
+def clear_backtest_caches() -> None:
+    """Drop cached backtest lookups after a run's status or metrics change.
+    
+    Safe to call from the backtest worker threads.
+    """
+    recent_backtests.clear()
+    load_backtest_bundle.clear()
+
+
+def clear_llm_config_caches() -> None:
+    """Drop cached LLM configuration lookups after a config is written."""
+    list_llm_configs.clear()
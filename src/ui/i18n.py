@@ -1,6 +1,7 @@
 """Internationalization utilities for Streamlit UI."""
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Dict
 
 _DEFAULT_LANGUAGE = "en"
@@ -366,6 +367,7 @@ TRANSLATIONS: Dict[str, Dict[str, str]] = {
         "builder.define.code_valid": "✓ Code is valid!",
         "builder.define.code_warnings": "Code has validation warnings:",
         "builder.define.update_code": "Update Code",
+        "builder.define.update_all": "Update All",
         
         # Save section
         "builder.define.save_header": "Save Strategy",
@@ -379,6 +381,11 @@ TRANSLATIONS: Dict[str, Dict[str, str]] = {
         "builder.saved.header": "Saved Strategies",
         "builder.saved.id": "**ID:** {value}",
         "builder.saved.created": "**Created:** {value}",
+        "builder.saved.select_hint": "Select a strategy in the table to view or edit it.",
+        "builder.saved.column_name": "Name",
+        "builder.saved.column_version": "Version",
+        "builder.saved.column_created": "Created",
+        "builder.saved.column_id": "ID",
         "builder.saved.format_human": "📖 Human Readable",
         "builder.saved.format_json": "⚙️ JSON",
         "builder.saved.format_code": "💻 Code",
@@ -457,6 +464,7 @@ TRANSLATIONS: Dict[str, Dict[str, str]] = {
         "results.metric.cagr": "CAGR",
         "results.metric.sortino": "Sortino Ratio",
         "results.metric.calmar": "Calmar Ratio",
+        "results.view.label": "View",
         "results.tabs.equity": "📈 Equity Curve",
         "results.tabs.metrics": "📊 Metrics",
         "results.tabs.trades": "📝 Trades",
@@ -877,6 +885,7 @@ TRANSLATIONS: Dict[str, Dict[str, str]] = {
         "builder.define.code_valid": "✓ 代码有效！",
         "builder.define.code_warnings": "代码存在校验警告：",
         "builder.define.update_code": "更新代码",
+        "builder.define.update_all": "全部更新",
         
         # Save section
         "builder.define.save_header": "保存策略",
@@ -890,6 +899,11 @@ TRANSLATIONS: Dict[str, Dict[str, str]] = {
         "builder.saved.header": "已保存策略",
         "builder.saved.id": "**ID：** {value}",
         "builder.saved.created": "**创建时间：** {value}",
+        "builder.saved.select_hint": "在表格中选择一个策略以查看或编辑。",
+        "builder.saved.column_name": "名称",
+        "builder.saved.column_version": "版本",
+        "builder.saved.column_created": "创建时间",
+        "builder.saved.column_id": "ID",
         "builder.saved.format_human": "📖 人类可读",
         "builder.saved.format_json": "⚙️ JSON",
         "builder.saved.format_code": "💻 代码",
@@ -968,6 +982,7 @@ TRANSLATIONS: Dict[str, Dict[str, str]] = {
         "results.metric.cagr": "年化收益率",
         "results.metric.sortino": "索提诺比率",
         "results.metric.calmar": "卡尔玛比率",
+        "results.view.label": "视图",
         "results.tabs.equity": "📈 权益曲线",
         "results.tabs.metrics": "📊 指标",
         "results.tabs.trades": "📝 交易记录",
@@ -1063,13 +1078,22 @@ def set_language(lang: str) -> None:
     st.session_state["language"] = lang if lang in codes else _DEFAULT_LANGUAGE
 
 
-def t(key: str, **kwargs) -> str:
-    """Translate a string by key with optional formatting."""
-    language = get_language()
+@lru_cache(maxsize=4096)
+def _template(language: str, key: str) -> str:
+    """Resolve the template for a key, falling back to the default language.
+
+    TRANSLATIONS is static, so each (language, key) pair is resolved once.
+    """
     template = TRANSLATIONS.get(language, {}).get(key)
 
     if template is None:
         template = TRANSLATIONS.get(_DEFAULT_LANGUAGE, {}).get(key, key)
+    return template
+
+
+def t(key: str, **kwargs) -> str:
+    """Translate a string by key with optional formatting."""
+    template = _template(get_language(), key)
 
     if kwargs:
         try:
@@ -0,0 +1,19 @@
+"""Ticker symbol input parsing shared across pages."""
+import re
+from typing import List
+
+# Anything that cannot appear in a ticker separates symbols
+_SYMBOL_SPLIT_RE = re.compile(r"[^A-Z0-9.\-^=]+")
+
+
+def parse_symbols(text: str) -> List[str]:
+    """Split free-form user input into upper-case ticker symbols.
+    
+    Args:
+        text: Symbols separated by commas, spaces or any other character
+            that cannot appear in a ticker
+    
+    Returns:
+        Symbols in input order, without empty entries
+    """
+    return [symbol for symbol in _SYMBOL_SPLIT_RE.split(text.upper()) if symbol]
@@ -1,4 +1,5 @@
 """Visualization module initialization."""
 from .charts import ChartGenerator
+from .downsample import lttb_downsample
 
-__all__ = ['ChartGenerator']
+__all__ = ['ChartGenerator', 'lttb_downsample']
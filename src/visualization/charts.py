@@ -7,6 +7,15 @@ import plotly.express as px
 import pandas as pd
 from typing import Optional, List
 
+# Above this many points line/marker traces render through WebGL
+# (Scattergl) instead of SVG, which keeps long curves responsive
+WEBGL_POINT_THRESHOLD = 1000
+
+
+def _scatter_type(n_points: int) -> type:
+    """Pick the Plotly scatter trace class for a series of n_points."""
+    return go.Scattergl if n_points > WEBGL_POINT_THRESHOLD else go.Scatter
+
 
 class ChartGenerator:
     """Generate interactive charts for backtest results."""
@@ -30,7 +39,7 @@ class ChartGenerator:
         fig = go.Figure()
         
         # Add strategy equity curve
-        fig.add_trace(go.Scatter(
+        fig.add_trace(_scatter_type(len(equity_df))(
             x=equity_df['date'],
             y=equity_df['value'],
             mode='lines',
@@ -40,7 +49,7 @@ class ChartGenerator:
         
         # Add benchmark if provided
         if benchmark_df is not None and not benchmark_df.empty:
-            fig.add_trace(go.Scatter(
+            fig.add_trace(_scatter_type(len(benchmark_df))(
                 x=benchmark_df['date'],
                 y=benchmark_df['value'],
                 mode='lines',
@@ -73,8 +82,9 @@ class ChartGenerator:
             Plotly figure
         """
         fig = go.Figure()
+        scatter = _scatter_type(len(equity_df))
 
-        fig.add_trace(go.Scatter(
+        fig.add_trace(scatter(
             x=equity_df['date'],
             y=equity_df['value'],
             mode='lines',
@@ -88,7 +98,7 @@ class ChartGenerator:
 
             if gain_mask.any():
                 gain_df = equity_df[gain_mask]
-                fig.add_trace(go.Scatter(
+                fig.add_trace(scatter(
                     x=gain_df['date'],
                     y=gain_df['value'],
                     mode='markers',
@@ -102,7 +112,7 @@ class ChartGenerator:
 
             if loss_mask.any():
                 loss_df = equity_df[loss_mask]
-                fig.add_trace(go.Scatter(
+                fig.add_trace(scatter(
                     x=loss_df['date'],
                     y=loss_df['value'],
                     mode='markers',
@@ -0,0 +1,75 @@
+"""
+Downsampling helpers for long time series.
+Keeps charts responsive by sending fewer points to the browser.
+"""
+import numpy as np
+import pandas as pd
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """Select point indices with Largest-Triangle-Three-Buckets.
+    
+    Args:
+        x: Monotonic x coordinates
+        y: Y values, same length as x
+        n_out: Number of points to keep
+        
+    Returns:
+        Sorted array of selected indices (always includes first and last)
+    """
+    n = len(y)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    # n_out - 2 buckets between the fixed first and last points
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    selected = np.empty(n_out, dtype=np.int64)
+    selected[0] = 0
+    selected[-1] = n - 1
+
+    anchor = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        next_end = edges[i + 2] if i + 2 < len(edges) else n
+        avg_x = x[end:next_end].mean()
+        avg_y = y[end:next_end].mean()
+
+        # Triangle area (times two) for every candidate in the bucket at once
+        area = np.abs(
+            (x[anchor] - avg_x) * (y[start:end] - y[anchor])
+            - (x[anchor] - x[start:end]) * (avg_y - y[anchor])
+        )
+        anchor = start + int(area.argmax())
+        selected[i + 1] = anchor
+
+    return selected
+
+
+def lttb_downsample(
+    df: pd.DataFrame,
+    n_out: int = 2000,
+    x_col: str = "date",
+    y_col: str = "value"
+) -> pd.DataFrame:
+    """Downsample a time series frame to at most n_out rows with LTTB.
+    
+    Args:
+        df: DataFrame sorted by x_col
+        n_out: Maximum number of rows to keep
+        x_col: Column used as the x axis (datetime or numeric)
+        y_col: Column whose shape should be preserved
+        
+    Returns:
+        DataFrame with the selected rows, or df unchanged if already small
+    """
+    if len(df) <= n_out:
+        return df
+
+    x_values = df[x_col]
+    if pd.api.types.is_datetime64_any_dtype(x_values):
+        x = x_values.to_numpy(dtype="datetime64[ns]").astype(np.int64).astype(np.float64)
+    else:
+        x = x_values.to_numpy(dtype=np.float64)
+    y = df[y_col].to_numpy(dtype=np.float64)
+
+    return df.iloc[lttb_indices(x, y, n_out)]
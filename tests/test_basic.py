@@ -3,10 +3,14 @@ Basic tests for Me Trade functionality.
 Run with: python -m pytest tests/
 """
 import pytest
+import numpy as np
 import pandas as pd
-from src.data import StockDataManager
+from src.data import IndicatorCalculator, IndicatorStorage, StockDataManager
+from src.data._indicator_kernels import FUSED_COLUMNS, _indicators_loop
+from src.db import Database
 from src.strategy import NLParser, StrategyCompiler, CodeValidator
-from src.backtest import MetricsCalculator
+from src.backtest import BacktestEngine, MetricsCalculator
+from src.visualization import lttb_downsample
 
 
 class TestDataManager:
@@ -160,6 +164,151 @@ class TestMetricsCalculator:
         
         assert isinstance(max_dd, float)
         assert max_dd <= 0  # Drawdown should be negative
+    
+    def test_max_drawdown_matches_pandas(self):
+        """Test max drawdown matches the cummax formula."""
+        calc = MetricsCalculator()
+        rng = np.random.default_rng(0)
+        values = pd.Series(100000 * np.cumprod(1 + rng.normal(0, 0.01, 500)))
+        equity = pd.DataFrame({'value': values})
+        
+        cummax = values.cummax()
+        expected = ((values - cummax) / cummax).min()
+        
+        assert calc.max_drawdown(equity) == pytest.approx(expected, rel=1e-12)
+        assert calc.max_drawdown(pd.DataFrame({'value': [100000.0]})) == 0.0
+    
+    def test_sharpe_and_sortino_match_pandas(self):
+        """Test Sharpe and Sortino match the pandas formulas."""
+        calc = MetricsCalculator()
+        rng = np.random.default_rng(1)
+        returns = pd.Series(rng.normal(0.0005, 0.01, 500))
+        daily_rf = (1 + calc.risk_free_rate) ** (1 / 252) - 1
+        
+        excess = returns - daily_rf
+        expected_sharpe = excess.mean() / excess.std() * np.sqrt(252)
+        downside = returns[returns < daily_rf]
+        expected_sortino = (returns.mean() - daily_rf) / downside.std() * np.sqrt(252)
+        
+        assert calc.sharpe_ratio(returns) == pytest.approx(expected_sharpe, rel=1e-9)
+        assert calc.sortino_ratio(returns) == pytest.approx(expected_sortino, rel=1e-9)
+    
+    def test_ratios_degenerate_inputs(self):
+        """Test Sharpe and Sortino return 0.0 when they are undefined."""
+        calc = MetricsCalculator()
+        
+        # Fewer than two returns: the sample std is undefined
+        for returns in (pd.Series([], dtype=float), pd.Series([0.01])):
+            assert calc.sharpe_ratio(returns) == 0.0
+            assert calc.sortino_ratio(returns) == 0.0
+        
+        # Zero standard deviation
+        assert calc.sharpe_ratio(pd.Series([0.0] * 10), risk_free_rate=0.0) == 0.0
+        flat_downside = pd.Series([-0.5, 0.5] * 5)
+        assert calc.sortino_ratio(flat_downside, risk_free_rate=0.0) == 0.0
+        
+        # A single return below the risk-free rate
+        assert calc.sortino_ratio(pd.Series([-0.01, 0.02, 0.03])) == 0.0
+
+
+class TestDownsample:
+    """Test chart downsampling."""
+    
+    def test_small_frame_unchanged(self):
+        """Test frames below the target size are returned as-is."""
+        equity = pd.DataFrame({
+            'date': pd.date_range('2020-01-01', periods=10),
+            'value': range(10)
+        })
+        
+        assert lttb_downsample(equity, n_out=20) is equity
+    
+    def test_lttb_keeps_endpoints_and_extremes(self):
+        """Test downsampling keeps first/last rows and the peak."""
+        values = [100000 + (i % 50) * 10 for i in range(5000)]
+        values[2500] = 500000
+        equity = pd.DataFrame({
+            'date': pd.date_range('2020-01-01', periods=len(values), freq='h'),
+            'value': values
+        })
+        
+        sampled = lttb_downsample(equity, n_out=200)
+        
+        assert len(sampled) == 200
+        assert sampled.index[0] == 0
+        assert sampled.index[-1] == len(values) - 1
+        assert 2500 in sampled.index
+        assert sampled.index.is_monotonic_increasing
+
+
+class TestIndicatorKernel:
+    """Test the fused indicator kernel."""
+    
+    def test_matches_pandas_indicators(self):
+        """Test every fused column matches IndicatorCalculator.calculate_all."""
+        rng = np.random.default_rng(0)
+        random_walk = 100 * np.cumprod(1 + rng.normal(0, 0.01, 600))
+        # Gains only, so the RSI loss average is zero
+        rising = np.linspace(100.0, 160.0, 300)
+        
+        for close in (random_walk, rising):
+            data = pd.DataFrame({
+                'date': pd.bdate_range('2020-01-01', periods=len(close)),
+                'close': close
+            })
+            expected = IndicatorCalculator.calculate_all(
+                data, ['sma_20', 'sma_50', 'sma_200', 'ema_12', 'ema_26', 'rsi', 'macd', 'bbands']
+            )
+            
+            fused = _indicators_loop(close)
+            
+            for row, column in enumerate(FUSED_COLUMNS):
+                np.testing.assert_allclose(
+                    fused[row], expected[column].to_numpy(), rtol=1e-12, atol=1e-10, err_msg=column
+                )
+
+
+class TestBacktestBatch:
+    """Test parallel batch backtests."""
+    
+    def test_batch_uses_engine_db_and_keeps_order(self, tmp_path, monkeypatch):
+        """Test worker processes read the engine's database and results keep job order."""
+        # Schema seeding compiles the built-in templates, which this test
+        # does not need
+        monkeypatch.setattr(StrategyCompiler, 'compile', lambda self, strategy: '')
+        db = Database(str(tmp_path / 'batch.db'))
+        db.initialize_schema()
+        
+        dates = pd.bdate_range('2020-01-01', periods=60).strftime('%Y-%m-%d')
+        db.executemany(
+            "INSERT INTO equities_ohlcv VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            [
+                ('AAA', d, '1d', 100.0 + i, 101.0 + i, 99.0 + i, 100.0 + i, 100.0 + i, 1000, 'test', 'test')
+                for i, d in enumerate(dates)
+            ]
+        )
+        IndicatorStorage(db).save_indicators('AAA', StockDataManager(db).get_cached_data('AAA'))
+        
+        code = (
+            "import backtrader as bt\n"
+            "class BuyAndHold(bt.Strategy):\n"
+            "    def next(self):\n"
+            "        if not self.position:\n"
+            "            self.buy(size=10)\n"
+        )
+        jobs = [
+            dict(strategy_code=code, universe=['AAA'], start=dates[0], end=dates[-1], initial_cash=cash)
+            for cash in (10000.0, 20000.0)
+        ]
+        
+        engine = BacktestEngine(db)
+        results = engine.run_backtest_batch(jobs, max_workers=2)
+        serial = [engine.run_backtest(**job) for job in jobs]
+        db.close()
+        
+        assert [r['success'] for r in results] == [True, True]
+        assert [r['starting_value'] for r in results] == [10000.0, 20000.0]
+        assert [r['ending_value'] for r in results] == [r['ending_value'] for r in serial]
 
 
 if __name__ == "__main__":